@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
 class Config:
     """Application configuration"""
     # Flask
@@ -39,7 +40,10 @@ class Config:
         'quotes': {'timeout': 30},      # 30 seconds for real-time quotes
         'historical': {'timeout': 3600}, # 1 hour for historical data
         'news': {'timeout': 300},       # 5 minutes for news
-        'technical': {'timeout': 60}    # 1 minute for technical indicators
+        'technical': {'timeout': 60},   # 1 minute for technical indicators
+        # Options chains move with the market: short TTL while US equities
+        # trade, longer once quotes stop updating
+        'options': {'timeout': 60, 'offhours_timeout': 900}
     }
     
     # Data Sources
@@ -75,16 +79,35 @@ class Config:
         }
     }
     
-    # JWT Configuration
+    # JWT Configuration. Tokens are signed with EdDSA (Ed25519): signing is
+    # ~20x faster than RSA, verification 2-3x, and the 64-byte signature
+    # keeps tokens small on the wire. Set JWT_ALGORITHM=HS256 to fall back
+    # to the shared-secret scheme.
+    JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'EdDSA')
+    JWT_PRIVATE_KEY = os.environ.get('JWT_PRIVATE_KEY')
+    JWT_PUBLIC_KEY = os.environ.get('JWT_PUBLIC_KEY')
+    if JWT_ALGORITHM == 'EdDSA' and not JWT_PRIVATE_KEY:
+        # Without shared PEMs every worker would need its own keypair and
+        # tokens issued by one could not verify on another; the symmetric
+        # secret is shared, so fall back to it
+        JWT_ALGORITHM = 'HS256'
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', SECRET_KEY)
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # Decode-cache window: dashboards polling cached endpoints every 30-60s
+    # re-present the same token, so a hit here skips signature verification
+    # entirely. Keep well below access-token expiry.
+    JWT_DECODE_CACHE_TTL = int(os.environ.get('JWT_DECODE_CACHE_TTL', 30))
+    JWT_DECODE_CACHE_MAXSIZE = int(os.environ.get('JWT_DECODE_CACHE_MAXSIZE', 10000))
     
     # WebSocket Configuration
     WEBSOCKET_PORT = int(os.environ.get('WEBSOCKET_PORT', 8765))
     WEBSOCKET_PING_INTERVAL = 30
     WEBSOCKET_PING_TIMEOUT = 10
     
+    # Numba - persist compiled kernels across processes
+    NUMBA_CACHE_DIR = os.environ.setdefault('NUMBA_CACHE_DIR', '.numba_cache')
+
     # Monitoring
     PROMETHEUS_ENABLED = os.environ.get('PROMETHEUS_ENABLED', 'True').lower() == 'true'
     PROMETHEUS_PORT = int(os.environ.get('PROMETHEUS_PORT', 9090))
@@ -5,10 +5,13 @@ from datetime import datetime
 import logging
 from collections import defaultdict
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from .sources.base import BaseDataSource, DataSourceStatus
 from .sources.yfinance_source import YFinanceSource
 from .sources.robin_stocks_source import RobinStocksSource
 from ..utils.cache import CacheManager
+from ..utils.concurrency import gather_limited
 from ..database.models import DataDownload, MarketData, db
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,11 @@ class DataAggregator:
         self.cache = cache_manager
         self.config = config
         self.sources: List[BaseDataSource] = []
+        # In-flight coalescing: concurrent requests for the same symbol
+        # within one event loop share a single upstream fetch. Keys carry
+        # the loop id because each Flask async view runs its own loop and
+        # futures cannot be awaited across loops.
+        self._inflight: Dict[Any, asyncio.Future] = {}
         self._initialize_sources()
         self.health_check_interval = 300  # 5 minutes
         self._start_health_monitoring()
@@ -38,6 +46,7 @@ class DataAggregator:
                     source_class = source_classes[source_name]
                     source = source_class()
                     source.priority = source_config.get('priority', 999)
+                    source.cache = self.cache
                     self.sources.append(source)
                     logger.info(f"Initialized data source: {source_name}")
                 except Exception as e:
@@ -48,7 +57,12 @@ class DataAggregator:
     
     def _start_health_monitoring(self):
         """Start background health monitoring"""
-        asyncio.create_task(self._health_monitor())
+        try:
+            asyncio.create_task(self._health_monitor())
+        except RuntimeError:
+            # Constructed outside a running loop (sync app startup);
+            # sources still report health on demand via health_check()
+            logger.debug("No running event loop; health monitor not started")
     
     async def _health_monitor(self):
         """Monitor health of all data sources"""
@@ -68,8 +82,35 @@ class DataAggregator:
             if source.status != DataSourceStatus.UNHEALTHY
         ]
     
+    async def _single_flight(self, key: str, fetch):
+        """Coalesce concurrent identical fetches onto one upstream call"""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            return await future
+
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[flight_key]
+
     async def get_quote(self, symbol: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """Get quote with failover across sources"""
+        return await self._single_flight(
+            f"quote:{symbol}",
+            lambda: self._fetch_quote(symbol, use_cache)
+        )
+
+    async def _fetch_quote(self, symbol: str, use_cache: bool) -> Optional[Dict[str, Any]]:
         # Check cache first
         if use_cache:
             cached = await self.cache.get(f"quote:{symbol}")
@@ -96,6 +137,62 @@ class DataAggregator:
         logger.warning(f"Failed to get quote for {symbol} from all sources")
         return None
     
+    async def get_quotes(self, symbols: List[str], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Get quotes for many symbols in bulk.
+
+        Cache hits resolve in one MGET round-trip. Misses go to each
+        source's own batch method where one exists (one upstream batch
+        instead of a request per symbol), with the per-symbol failover
+        path as fallback for whatever is left. Returns symbol -> quote
+        for whatever resolved; failed symbols are simply absent.
+        """
+        quotes: Dict[str, Any] = {}
+        remaining = list(dict.fromkeys(symbols))
+
+        if use_cache and remaining:
+            cached = await self.cache.get_many(
+                [f"quote:{symbol}" for symbol in remaining]
+            )
+            if cached:
+                quotes = {
+                    symbol: cached[f"quote:{symbol}"]
+                    for symbol in remaining
+                    if f"quote:{symbol}" in cached
+                }
+                remaining = [s for s in remaining if s not in quotes]
+
+        for source in self._get_healthy_sources():
+            if not remaining:
+                break
+            bulk = getattr(source, 'get_quotes', None)
+            if bulk is None:
+                continue
+            try:
+                results = await bulk(remaining)
+            except Exception as e:
+                logger.error(f"Error getting bulk quotes from {source.name}: {e}")
+                source.record_error()
+                continue
+            if results:
+                await self.cache.set_many(
+                    {f"quote:{s}": quote for s, quote in results.items()},
+                    timeout=self.config['CACHE_STRATEGIES']['quotes']['timeout']
+                )
+                quotes.update(results)
+                remaining = [s for s in remaining if s not in quotes]
+
+        # Per-symbol failover for symbols no bulk-capable source resolved
+        if remaining:
+            results = await gather_limited(
+                self.get_quote(symbol, use_cache=False) for symbol in remaining
+            )
+            for symbol, result in zip(remaining, results):
+                if result and not isinstance(result, Exception):
+                    quotes[symbol] = result
+
+        return quotes
+
     async def get_historical(
         self,
         symbol: str,
@@ -255,20 +352,32 @@ class DataAggregator:
     
     async def _save_historical_data(self, data: List[Dict[str, Any]], symbol: str, source: str):
         """Save historical data to TimescaleDB"""
+        if not data:
+            return
+
         try:
-            for point in data:
-                market_data = MarketData(
-                    time=datetime.fromisoformat(point['timestamp']),
-                    symbol=symbol,
-                    open=point['open'],
-                    high=point['high'],
-                    low=point['low'],
-                    close=point['close'],
-                    volume=point['volume'],
-                    source=source
-                )
-                db.session.add(market_data)
-            
+            # Bulk insert: one multi-row statement instead of an ORM object
+            # and flush per tick, amortizing round-trip and WAL overhead
+            # across the batch. ON CONFLICT makes re-downloads idempotent
+            # against the (time, symbol) primary key.
+            rows = [
+                {
+                    'time': datetime.fromisoformat(point['timestamp']),
+                    'symbol': symbol,
+                    'open': point['open'],
+                    'high': point['high'],
+                    'low': point['low'],
+                    'close': point['close'],
+                    'volume': point['volume'],
+                    'source': source
+                }
+                for point in data
+            ]
+
+            stmt = pg_insert(MarketData).on_conflict_do_nothing(
+                index_elements=['time', 'symbol']
+            )
+            db.session.execute(stmt, rows)
             db.session.commit()
             logger.info(f"Saved {len(data)} data points for {symbol}")
             
@@ -300,21 +409,74 @@ class DataAggregator:
             logger.error(f"Error recording download: {e}")
             db.session.rollback()
     
-    async def get_options_chain(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get options chain with failover"""
+    def _options_chain_ttl(self) -> int:
+        """Cache TTL for options chains, aligned to trading cadence"""
+        strategy = self.config['CACHE_STRATEGIES']['options']
+        now = datetime.utcnow()
+        # US equities regular session, 13:30-20:00 UTC on weekdays; chains
+        # are static outside it so the longer timeout applies
+        intraday = (
+            now.weekday() < 5
+            and (13, 30) <= (now.hour, now.minute) < (20, 0)
+        )
+        return strategy['timeout'] if intraday else strategy['offhours_timeout']
+
+    async def get_options_chain(self, symbol: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get options chain with failover, coalescing concurrent fetches"""
+        return await self._single_flight(
+            f"options:{symbol}",
+            lambda: self._fetch_options_chain(symbol, use_cache)
+        )
+
+    async def _fetch_options_chain(self, symbol: str, use_cache: bool) -> Optional[Dict[str, Any]]:
+        if use_cache:
+            cached = await self.cache.get(f"options:{symbol}")
+            if cached:
+                return cached
+
         for source in self._get_healthy_sources():
             try:
                 result = await source.get_options_chain(symbol)
                 if result:
+                    await self.cache.set(
+                        f"options:{symbol}",
+                        result,
+                        timeout=self._options_chain_ttl()
+                    )
                     return result
             except Exception as e:
                 logger.error(f"Error getting options from {source.name}: {e}")
                 source.record_error()
-        
+
         return None
-    
+
+    async def get_expirations(self, symbol: str) -> Optional[List[str]]:
+        """Get option expiration dates with failover"""
+        # A cached chain already carries its expirations; read that field
+        # instead of a separate upstream call
+        cached = await self.cache.get(f"options:{symbol}")
+        if cached and cached.get('expirations'):
+            return list(cached['expirations'])
+
+        for source in self._get_healthy_sources():
+            try:
+                result = await source.get_expirations(symbol)
+                if result:
+                    return result
+            except Exception as e:
+                logger.error(f"Error getting expirations from {source.name}: {e}")
+                source.record_error()
+
+        return None
+
     async def get_crypto_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get crypto data with failover"""
+        return await self._single_flight(
+            f"crypto:{symbol}",
+            lambda: self._fetch_crypto_data(symbol)
+        )
+
+    async def _fetch_crypto_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         for source in self._get_healthy_sources():
             try:
                 result = await source.get_crypto_data(symbol)
@@ -2,6 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+import itertools
 import logging
 from enum import Enum
 
@@ -23,6 +24,22 @@ class BaseDataSource(ABC):
         self.last_health_check = datetime.utcnow()
         self.error_count = 0
         self.success_count = 0
+        # itertools.count advances atomically under the GIL, so the batch
+        # thread-pool paths can record results without a lock; resets are
+        # expressed as a floor rather than rewinding the counter
+        self._success_counter = itertools.count(1)
+        self._error_counter = itertools.count(1)
+        self._error_floor = 0
+
+    def _count_error(self) -> int:
+        """Advance the error counter; returns errors since the last reset"""
+        self.error_count = next(self._error_counter) - self._error_floor
+        return self.error_count
+
+    def _reset_errors(self):
+        """Start a fresh error window without touching other threads' counts"""
+        self._error_floor = next(self._error_counter)
+        self.error_count = 0
         
     @abstractmethod
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
@@ -49,6 +66,17 @@ class BaseDataSource(ABC):
     async def get_crypto_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cryptocurrency data"""
         pass
+
+    async def get_expirations(self, symbol: str) -> Optional[List[str]]:
+        """Get option expiration dates.
+
+        Sources with a cheap expirations-only endpoint should override
+        this; the fallback pulls the full chain and keeps just the index.
+        """
+        chain = await self.get_options_chain(symbol)
+        if not chain:
+            return None
+        return chain.get('expirations', [])
     
     async def health_check(self) -> DataSourceStatus:
         """Check health of the data source"""
@@ -57,13 +85,12 @@ class BaseDataSource(ABC):
             result = await self.get_quote("AAPL")
             if result:
                 self.status = DataSourceStatus.HEALTHY
-                self.error_count = 0
+                self._reset_errors()
             else:
                 self.status = DataSourceStatus.DEGRADED
         except Exception as e:
             logger.error(f"Health check failed for {self.name}: {e}")
-            self.error_count += 1
-            if self.error_count >= 3:
+            if self._count_error() >= 3:
                 self.status = DataSourceStatus.UNHEALTHY
             else:
                 self.status = DataSourceStatus.DEGRADED
@@ -73,17 +100,16 @@ class BaseDataSource(ABC):
     
     def record_success(self):
         """Record successful operation"""
-        self.success_count += 1
+        self.success_count = next(self._success_counter)
         if self.success_count > 10 and self.status != DataSourceStatus.HEALTHY:
             self.status = DataSourceStatus.HEALTHY
-            self.error_count = 0
-    
+            self._reset_errors()
+
     def record_error(self):
         """Record failed operation"""
-        self.error_count += 1
-        if self.error_count >= 3:
+        if self._count_error() >= 3:
             self.status = DataSourceStatus.UNHEALTHY
-        elif self.error_count >= 1:
+        else:
             self.status = DataSourceStatus.DEGRADED
 
 
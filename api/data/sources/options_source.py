@@ -6,15 +6,17 @@ Supports multiple providers including CBOE, OCC, and broker APIs.
 
 import asyncio
 import aiohttp
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from scipy.stats import norm
 import logging
-import json
+import orjson
 
 from .base import BaseDataSource, DataSourceStatus
+from ...utils.timestamps import iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +93,7 @@ class CBOEOptionsSource(OptionsDataSource):
                 'expirations': expirations,
                 'chains': chains,
                 'source': self.name,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': iso_now()
             }
             
         except Exception as e:
@@ -109,7 +111,7 @@ class CBOEOptionsSource(OptionsDataSource):
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     return data.get('last', 0)
         except Exception as e:
             logger.error(f"Error getting spot price: {e}")
@@ -125,7 +127,7 @@ class CBOEOptionsSource(OptionsDataSource):
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     return data.get('expirations', [])
         except Exception as e:
             logger.error(f"Error getting expirations: {e}")
@@ -143,7 +145,7 @@ class CBOEOptionsSource(OptionsDataSource):
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     
                     # Process and calculate Greeks
                     calls = []
@@ -157,8 +159,8 @@ class CBOEOptionsSource(OptionsDataSource):
                             puts.append(processed)
                     
                     return {
-                        'calls': sorted(calls, key=lambda x: x['strike']),
-                        'puts': sorted(puts, key=lambda x: x['strike'])
+                        'calls': sorted(calls, key=itemgetter('strike')),
+                        'puts': sorted(puts, key=itemgetter('strike'))
                     }
         except Exception as e:
             logger.error(f"Error getting chain for expiration: {e}")
@@ -219,7 +221,7 @@ class CBOEOptionsSource(OptionsDataSource):
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     
                     # Process historical data
                     historical = []
@@ -273,7 +275,7 @@ class TDAOptionsSource(OptionsDataSource):
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     return self._process_tda_chain(data)
                     
         except Exception as e:
@@ -299,7 +301,7 @@ class TDAOptionsSource(OptionsDataSource):
             'expirations': [],
             'chains': {},
             'source': self.name,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }
         
         # Process calls
@@ -431,23 +433,43 @@ class OptionsAggregator:
         vol = 0.3
         tolerance = 1e-5
         max_iterations = 100
-        
+
+        # None of these depend on vol, so compute them once instead of
+        # re-evaluating four transcendentals on every Newton iteration
+        log_SK = np.log(spot_price / strike_price)
+        sqrt_T = np.sqrt(time_to_expiry)
+        disc_q = np.exp(-dividend_yield * time_to_expiry)
+        disc_r = np.exp(-risk_free_rate * time_to_expiry)
+
+        # No-arbitrage bounds: prices at or below intrinsic value (or at or
+        # above the maximum attainable price) have no finite implied vol, so
+        # skip the Newton loop entirely rather than letting it diverge
+        if option_type == 'call':
+            intrinsic = max(spot_price * disc_q - strike_price * disc_r, 0.0)
+            max_price = spot_price * disc_q
+        else:
+            intrinsic = max(strike_price * disc_r - spot_price * disc_q, 0.0)
+            max_price = strike_price * disc_r
+
+        if option_price <= intrinsic + 1e-8 or option_price >= max_price - 1e-8:
+            return float('nan')
+
         for i in range(max_iterations):
             # Calculate option price and vega
-            d1 = (np.log(spot_price / strike_price) + 
-                  (risk_free_rate - dividend_yield + 0.5 * vol ** 2) * time_to_expiry) / (vol * np.sqrt(time_to_expiry))
-            
-            d2 = d1 - vol * np.sqrt(time_to_expiry)
-            
+            d1 = (log_SK +
+                  (risk_free_rate - dividend_yield + 0.5 * vol * vol) * time_to_expiry) / (vol * sqrt_T)
+
+            d2 = d1 - vol * sqrt_T
+
             if option_type == 'call':
-                theoretical_price = (spot_price * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(d1) - 
-                                   strike_price * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2))
+                theoretical_price = (spot_price * disc_q * norm.cdf(d1) -
+                                   strike_price * disc_r * norm.cdf(d2))
             else:
-                theoretical_price = (strike_price * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) - 
-                                   spot_price * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(-d1))
-            
+                theoretical_price = (strike_price * disc_r * norm.cdf(-d2) -
+                                   spot_price * disc_q * norm.cdf(-d1))
+
             # Vega
-            vega = spot_price * norm.pdf(d1) * np.sqrt(time_to_expiry) * np.exp(-dividend_yield * time_to_expiry) / 100
+            vega = spot_price * norm.pdf(d1) * sqrt_T * disc_q / 100
             
             # Price difference
             price_diff = theoretical_price - option_price
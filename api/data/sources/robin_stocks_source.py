@@ -1,9 +1,31 @@
 # api/data/sources/robin_stocks_source.py
+import math
 import robin_stocks.robinhood as rh
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
 from .base import BaseDataSource
+from ...utils.timestamps import iso_now
+
+# Static request-shaping tables, hoisted out of get_historical so they are
+# not rebuilt (and the span branch ladder not re-evaluated) on every call
+_INTERVAL_MAP = {
+    "1m": "5minute",
+    "5m": "5minute",
+    "10m": "10minute",
+    "1h": "hour",
+    "1d": "day",
+    "1w": "week"
+}
+
+_SPAN_CUTOFFS = (
+    (1, "day"),
+    (7, "week"),
+    (31, "month"),
+    (93, "3month"),
+    (365, "year"),
+    (math.inf, "5year")
+)
 
 class RobinStocksSource(BaseDataSource):
     """Robin Stocks (Robinhood) data source implementation"""
@@ -51,7 +73,7 @@ class RobinStocksSource(BaseDataSource):
                 'previousClose': float(fund.get('previous_close', 0)),
                 'marketCap': float(fund.get('market_cap', 0)),
                 'pe': float(fund.get('pe_ratio', 0)) if fund.get('pe_ratio') else None,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': iso_now(),
                 'source': self.name
             }
             
@@ -75,32 +97,12 @@ class RobinStocksSource(BaseDataSource):
             await self._ensure_login()
             
             # Map intervals
-            interval_map = {
-                "1m": "5minute",
-                "5m": "5minute",
-                "10m": "10minute",
-                "1h": "hour",
-                "1d": "day",
-                "1w": "week"
-            }
-            
-            rh_interval = interval_map.get(interval, "day")
-            
+            rh_interval = _INTERVAL_MAP.get(interval, "day")
+
             # Calculate span
             delta = end_date - start_date
-            if delta.days <= 1:
-                span = "day"
-            elif delta.days <= 7:
-                span = "week"
-            elif delta.days <= 31:
-                span = "month"
-            elif delta.days <= 93:
-                span = "3month"
-            elif delta.days <= 365:
-                span = "year"
-            else:
-                span = "5year"
-            
+            span = next(s for cutoff, s in _SPAN_CUTOFFS if delta.days <= cutoff)
+
             # Get historical data
             historicals = rh.stocks.get_stock_historicals(
                 symbol,
@@ -194,7 +196,7 @@ class RobinStocksSource(BaseDataSource):
                 'high': float(crypto_info['high_price']),
                 'low': float(crypto_info['low_price']),
                 'volume': float(crypto_info['volume']),
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': iso_now(),
                 'source': self.name
             }
             
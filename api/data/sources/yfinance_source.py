@@ -2,54 +2,199 @@
 import yfinance as yf
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import logging
 import pandas as pd
+import requests
 from .base import BaseDataSource
+from ...utils.timestamps import iso_now
+
+logger = logging.getLogger(__name__)
 
 class YFinanceSource(BaseDataSource):
     """Yahoo Finance data source implementation"""
-    
+
+    # Short TTLs: quotes go stale in seconds, history barely moves intraday
+    QUOTE_CACHE_TTL = 2
+    HISTORICAL_CACHE_TTL = 3600
+
     def __init__(self):
         super().__init__("yfinance", priority=1)
-        
-    async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        # Optional CacheManager injected by the aggregator; collapses repeated
+        # fetches of the same symbol (e.g. the streaming tick loop) into one
+        # Yahoo round-trip per TTL window
+        self.cache = None
+        # Single-flight map: concurrent callers for the same key await one
+        # upstream fetch instead of each firing their own. Keys carry the
+        # loop id because each Flask async view runs its own loop and
+        # futures cannot be awaited across loops.
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        # Shared HTTP session (keep-alive, one cookie/crumb bootstrap) and
+        # memoized Ticker objects so yfinance's per-ticker caches survive
+        # across calls
+        self._session = requests.Session()
+        self._tickers: Dict[str, yf.Ticker] = {}
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """Get the cached Ticker for a symbol, creating it on first use"""
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol, session=self._session)
+            self._tickers[symbol] = ticker
+        return ticker
+
+    async def _single_flight(self, key: str, fetch) -> Any:
+        """Run fetch() once per key; concurrent callers share the result"""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        existing = self._inflight.get(flight_key)
+        if existing is not None:
+            return await existing
+
+        fut = loop.create_future()
+        self._inflight[flight_key] = fut
+        try:
+            result = await fetch()
+            fut.set_result(result)
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            del self._inflight[flight_key]
+
+        return result
+
+    def _build_quote(
+        self,
+        symbol: str,
+        ticker: yf.Ticker,
+        include_fundamentals: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the standard quote dict from a ticker (blocking).
+
+        Uses fast_info (a single quote endpoint) rather than info, which
+        scrapes several pages per call; the slow info fetch only happens when
+        fundamentals (pe/eps) are explicitly requested.
+        """
+        fi = ticker.fast_info
+
+        def field(name):
+            try:
+                return fi[name]
+            except (KeyError, AttributeError):
+                return None
+
+        price = field('lastPrice')
+        if price is None:
+            return None
+
+        previous_close = field('previousClose')
+        change = price - previous_close if previous_close else None
+
+        quote = {
+            'symbol': symbol,
+            'price': price,
+            'open': field('open'),
+            'high': field('dayHigh'),
+            'low': field('dayLow'),
+            'volume': field('lastVolume'),
+            'previousClose': previous_close,
+            'change': change,
+            'changePercent': (change / previous_close * 100) if change is not None else None,
+            'marketCap': field('marketCap'),
+            'timestamp': iso_now(),
+            'source': self.name
+        }
+
+        if include_fundamentals:
+            info = ticker.info or {}
+            quote['bid'] = info.get('bid')
+            quote['ask'] = info.get('ask')
+            quote['bidSize'] = info.get('bidSize')
+            quote['askSize'] = info.get('askSize')
+            quote['pe'] = info.get('trailingPE')
+            quote['eps'] = info.get('trailingEps')
+
+        return quote
+
+    async def get_quote(
+        self,
+        symbol: str,
+        include_fundamentals: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """Get real-time quote using yfinance"""
+        return await self._single_flight(
+            f"quote:{symbol}:{int(include_fundamentals)}",
+            lambda: self._fetch_quote(symbol, include_fundamentals)
+        )
+
+    async def _fetch_quote(
+        self,
+        symbol: str,
+        include_fundamentals: bool = False
+    ) -> Optional[Dict[str, Any]]:
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            if not info:
+            cache_key = f"yf:quote:{symbol}:{int(include_fundamentals)}"
+            if self.cache:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    return cached
+
+            quote = self._build_quote(symbol, self._ticker(symbol), include_fundamentals)
+
+            if not quote:
                 self.record_error()
                 return None
-                
-            quote = {
-                'symbol': symbol,
-                'price': info.get('regularMarketPrice', info.get('price')),
-                'open': info.get('regularMarketOpen', info.get('open')),
-                'high': info.get('regularMarketDayHigh', info.get('dayHigh')),
-                'low': info.get('regularMarketDayLow', info.get('dayLow')),
-                'volume': info.get('regularMarketVolume', info.get('volume')),
-                'previousClose': info.get('regularMarketPreviousClose', info.get('previousClose')),
-                'change': info.get('regularMarketChange'),
-                'changePercent': info.get('regularMarketChangePercent'),
-                'bid': info.get('bid'),
-                'ask': info.get('ask'),
-                'bidSize': info.get('bidSize'),
-                'askSize': info.get('askSize'),
-                'marketCap': info.get('marketCap'),
-                'pe': info.get('trailingPE'),
-                'eps': info.get('trailingEps'),
-                'timestamp': datetime.utcnow().isoformat(),
-                'source': self.name
-            }
-            
+
+            if self.cache:
+                await self.cache.set(cache_key, quote, timeout=self.QUOTE_CACHE_TTL)
+
             self.record_success()
             return quote
-            
+
         except Exception as e:
             logger.error(f"YFinance quote error for {symbol}: {e}")
             self.record_error()
             return None
+
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for multiple symbols with one shared yfinance session.
+
+        Uses a single yf.Tickers batch plus a small thread pool, so N symbols
+        cost a handful of concurrent round-trips instead of N serial ones.
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            quotes = await loop.run_in_executor(None, self._fetch_quote_batch, symbols)
+
+            if quotes:
+                self.record_success()
+            return quotes
+
+        except Exception as e:
+            logger.error(f"YFinance batch quote error: {e}")
+            self.record_error()
+            return {}
+
+    def _fetch_quote_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch a batch of quotes concurrently (blocking)"""
+        batch = yf.Tickers(" ".join(symbols), session=self._session)
+        quotes = {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+            results = pool.map(
+                lambda s: self._build_quote(s, batch.tickers[s.upper()]),
+                symbols
+            )
+            for symbol, quote in zip(symbols, results):
+                if quote:
+                    quotes[symbol] = quote
+
+        return quotes
     
     async def get_historical(
         self,
@@ -59,8 +204,28 @@ class YFinanceSource(BaseDataSource):
         interval: str = "1d"
     ) -> Optional[List[Dict[str, Any]]]:
         """Get historical data with maximum granularity"""
+        return await self._single_flight(
+            f"hist:{symbol}:{start_date:%Y%m%d}:{end_date:%Y%m%d}:{interval}",
+            lambda: self._fetch_historical(symbol, start_date, end_date, interval)
+        )
+
+    async def _fetch_historical(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d"
+    ) -> Optional[List[Dict[str, Any]]]:
         try:
-            ticker = yf.Ticker(symbol)
+            cache_key = (
+                f"yf:hist:{symbol}:{start_date:%Y%m%d}:{end_date:%Y%m%d}:{interval}"
+            )
+            if self.cache:
+                cached = await self.cache.get(cache_key)
+                if cached:
+                    return cached
+
+            ticker = self._ticker(symbol)
             
             # Convert interval to yfinance format
             yf_interval_map = {
@@ -89,21 +254,36 @@ class YFinanceSource(BaseDataSource):
             if df.empty:
                 self.record_error()
                 return None
-            
-            # Convert to list of dicts
-            data = []
-            for index, row in df.iterrows():
-                data.append({
-                    'timestamp': index.isoformat(),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': int(row['Volume']),
+
+            # Convert columns in bulk (tolist() is a single C-level pass to
+            # native Python types); iterrows boxes every cell row by row and
+            # was the hot spot for long histories
+            timestamps = df.index.map(pd.Timestamp.isoformat)
+            opens = df['Open'].to_numpy(dtype=float).tolist()
+            highs = df['High'].to_numpy(dtype=float).tolist()
+            lows = df['Low'].to_numpy(dtype=float).tolist()
+            closes = df['Close'].to_numpy(dtype=float).tolist()
+            volumes = df['Volume'].to_numpy(dtype='int64').tolist()
+
+            data = [
+                {
+                    'timestamp': t,
+                    'open': o,
+                    'high': h,
+                    'low': lo,
+                    'close': c,
+                    'volume': v,
                     'symbol': symbol,
                     'source': self.name
-                })
-            
+                }
+                for t, o, h, lo, c, v in zip(
+                    timestamps, opens, highs, lows, closes, volumes
+                )
+            ]
+
+            if self.cache:
+                await self.cache.set(cache_key, data, timeout=self.HISTORICAL_CACHE_TTL)
+
             self.record_success()
             return data
             
@@ -115,7 +295,7 @@ class YFinanceSource(BaseDataSource):
     async def get_options_chain(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get options chain data"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = self._ticker(symbol)
             
             # Get expiration dates
             expirations = ticker.options
@@ -145,6 +325,23 @@ class YFinanceSource(BaseDataSource):
             self.record_error()
             return None
     
+    async def get_expirations(self, symbol: str) -> Optional[List[str]]:
+        """Get option expiration dates without fetching any chains"""
+        try:
+            # ticker.options is a single metadata request; the base-class
+            # fallback would download five full chains just to discard them
+            expirations = self._ticker(symbol).options
+            if not expirations:
+                return None
+
+            self.record_success()
+            return list(expirations)
+
+        except Exception as e:
+            logger.error(f"YFinance expirations error for {symbol}: {e}")
+            self.record_error()
+            return None
+
     async def get_crypto_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cryptocurrency data"""
         try:
@@ -1,4 +1,15 @@
 # api/data/stream_client.py
+import asyncio
+import logging
+from collections import defaultdict
+from typing import List
+
+import orjson
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
 class StreamClient:
     """Client for connecting to WebSocket stream"""
     
@@ -34,7 +45,7 @@ class StreamClient:
         if not self.websocket:
             raise ConnectionError("Not connected to server")
         
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(orjson.dumps({
             'type': 'subscribe',
             'symbols': symbols,
             'data_types': data_types or ['quotes']
@@ -45,7 +56,7 @@ class StreamClient:
         if not self.websocket:
             raise ConnectionError("Not connected to server")
         
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(orjson.dumps({
             'type': 'unsubscribe',
             'symbols': symbols
         }))
@@ -59,7 +70,7 @@ class StreamClient:
         while self.running:
             try:
                 message = await self.websocket.recv()
-                data = json.loads(message)
+                data = orjson.loads(message)
                 
                 event_type = data.get('type')
                 if event_type in self.handlers:
@@ -72,6 +83,57 @@ class StreamClient:
                 logger.error(f"Error handling message: {e}")
 
 
+class StreamClientPool:
+    """
+    Pool of StreamClients that shards subscriptions across connections.
+
+    A single websocket caps out on per-connection throughput (and brokers
+    cap symbols per socket); sharding by hash(symbol) spreads both load and
+    symbol count over pool_size parallel connections while handlers behave
+    exactly as on a single StreamClient.
+    """
+
+    def __init__(self, url: str = "ws://localhost:8765", pool_size: int = 4):
+        self.url = url
+        self.pool_size = pool_size
+        self.members = [StreamClient(url) for _ in range(pool_size)]
+
+    async def connect(self):
+        """Connect all pool members in parallel"""
+        await asyncio.gather(*(member.connect() for member in self.members))
+
+    async def disconnect(self):
+        """Disconnect all pool members"""
+        await asyncio.gather(*(member.disconnect() for member in self.members))
+
+    def on(self, event_type: str, handler):
+        """Register an event handler on every member"""
+        for member in self.members:
+            member.on(event_type, handler)
+
+    def _group_by_shard(self, symbols: List[str]):
+        groups = defaultdict(list)
+        for symbol in symbols:
+            groups[hash(symbol) % self.pool_size].append(symbol)
+        return groups
+
+    async def subscribe(self, symbols: List[str], data_types: List[str] = None):
+        """Subscribe, sharding symbols across the pool"""
+        groups = self._group_by_shard(symbols)
+        await asyncio.gather(*(
+            self.members[shard].subscribe(group, data_types)
+            for shard, group in groups.items()
+        ))
+
+    async def unsubscribe(self, symbols: List[str]):
+        """Unsubscribe from the members that own each symbol"""
+        groups = self._group_by_shard(symbols)
+        await asyncio.gather(*(
+            self.members[shard].unsubscribe(group)
+            for shard, group in groups.items()
+        ))
+
+
 # Example usage
 async def example_stream_usage():
     """Example of using the streaming client"""
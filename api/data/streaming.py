@@ -1,12 +1,43 @@
 # api/data/streaming.py
 import asyncio
+import random
+import sys
 import websockets
-import json
+import orjson
 import logging
-from typing import Dict, Set, List, Any, Optional
+from typing import Dict, Set, List, Any, Optional, Tuple
 from datetime import datetime
+from collections import defaultdict
 from dataclasses import dataclass, asdict
-import aioredis
+# aioredis 2.x was merged into redis-py as redis.asyncio (and the old
+# package no longer imports on Python 3.11); same client API
+import redis.asyncio as aioredis
+
+try:
+    # libuv-based event loop; the broadcast path is loop-bound, so faster
+    # socket readiness and task scheduling translate directly to throughput
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+try:
+    # Compiled fixed-schema encoder for the highest-volume frame type;
+    # skips dict construction and key hashing entirely. Optional — the
+    # orjson dict path below is the fallback.
+    import msgspec
+
+    class MarketDataMsg(msgspec.Struct):
+        type: str
+        data_type: str
+        symbol: str
+        price: float
+        volume: int
+        timestamp: str
+
+    _MARKET_DATA_ENCODER = msgspec.json.Encoder()
+except ImportError:
+    msgspec = None
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +62,9 @@ class WebSocketServer:
         self.redis_url = redis_url
         self.clients: Dict[str, websockets.WebSocketServerProtocol] = {}
         self.subscriptions: Dict[str, StreamSubscription] = {}
+        # Reverse index (symbol, data_type) -> client ids, so fanout looks up
+        # its recipients directly instead of scanning every subscription
+        self._routing: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
         self.redis_client = None
         self.server = None
         self.running = False
@@ -40,7 +74,7 @@ class WebSocketServer:
         try:
             # Connect to Redis for pub/sub
             if self.redis_url:
-                self.redis_client = await aioredis.create_redis_pool(self.redis_url)
+                self.redis_client = aioredis.from_url(self.redis_url)
             
             # Start server
             self.server = await websockets.serve(
@@ -48,15 +82,26 @@ class WebSocketServer:
                 self.host,
                 self.port,
                 ping_interval=30,
-                ping_timeout=10
+                ping_timeout=10,
+                # permessage-deflate recompresses every fanout frame per
+                # client and dominates CPU for small market-data payloads
+                compression=None,
+                # Bound per-connection buffering so a stalled consumer applies
+                # backpressure instead of growing the outbound queue unbounded
+                max_queue=64
             )
             
             self.running = True
             logger.info(f"WebSocket server started on {self.host}:{self.port}")
-            
+
             # Start data streaming tasks
             asyncio.create_task(self._stream_market_data())
             asyncio.create_task(self._stream_news())
+
+            # With Redis configured, fanout is routed through pub/sub so
+            # multiple server processes can share one publisher
+            if self.redis_client:
+                asyncio.create_task(self._consume_market_data_channel())
             
         except Exception as e:
             logger.error(f"Failed to start WebSocket server: {e}")
@@ -77,8 +122,7 @@ class WebSocketServer:
         
         # Close Redis
         if self.redis_client:
-            self.redis_client.close()
-            await self.redis_client.wait_closed()
+            await self.redis_client.close()
         
         logger.info("WebSocket server stopped")
     
@@ -112,7 +156,7 @@ class WebSocketServer:
     async def handle_message(self, client_id: str, message: str):
         """Handle message from client"""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             msg_type = data.get('type')
             
             if msg_type == 'subscribe':
@@ -124,7 +168,7 @@ class WebSocketServer:
             else:
                 await self.send_error(client_id, f"Unknown message type: {msg_type}")
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             await self.send_error(client_id, "Invalid JSON")
         except Exception as e:
             logger.error(f"Error handling message from {client_id}: {e}")
@@ -132,8 +176,10 @@ class WebSocketServer:
     
     async def handle_subscribe(self, client_id: str, data: Dict[str, Any]):
         """Handle subscription request"""
-        symbols = set(data.get('symbols', []))
-        data_types = set(data.get('data_types', ['quotes']))
+        # Intern at ingress: the symbol universe is small, so set membership
+        # and routing lookups hit CPython's pointer-equality fast path
+        symbols = {sys.intern(s) for s in data.get('symbols', [])}
+        data_types = {sys.intern(dt) for dt in data.get('data_types', ['quotes'])}
         
         if not symbols:
             await self.send_error(client_id, "No symbols provided")
@@ -151,7 +197,12 @@ class WebSocketServer:
                 data_types=data_types
             )
             self.subscriptions[client_id] = sub
-        
+
+        # Update routing index (idempotent for already-registered pairs)
+        for sym in sub.symbols:
+            for dt in sub.data_types:
+                self._routing[(sym, dt)].add(client_id)
+
         # Send confirmation
         await self.send_message(client_id, {
             'type': 'subscribed',
@@ -164,7 +215,7 @@ class WebSocketServer:
     
     async def handle_unsubscribe(self, client_id: str, data: Dict[str, Any]):
         """Handle unsubscription request"""
-        symbols = set(data.get('symbols', []))
+        symbols = {sys.intern(s) for s in data.get('symbols', [])}
         
         if client_id not in self.subscriptions:
             await self.send_error(client_id, "No active subscription")
@@ -172,7 +223,8 @@ class WebSocketServer:
         
         sub = self.subscriptions[client_id]
         sub.symbols.difference_update(symbols)
-        
+        self._drop_routing(client_id, symbols, sub.data_types)
+
         if not sub.symbols:
             del self.subscriptions[client_id]
         
@@ -187,7 +239,9 @@ class WebSocketServer:
         """Send message to specific client"""
         if client_id in self.clients:
             try:
-                await self.clients[client_id].send(json.dumps(data))
+                # orjson returns bytes, which websockets sends as-is — no
+                # extra str→bytes encode per frame
+                await self.clients[client_id].send(orjson.dumps(data))
             except Exception as e:
                 logger.error(f"Error sending to {client_id}: {e}")
                 await self.disconnect_client(client_id)
@@ -202,21 +256,14 @@ class WebSocketServer:
     
     async def broadcast(self, data: Dict[str, Any], filter_func=None):
         """Broadcast message to all or filtered clients"""
-        disconnected = []
-        
-        for client_id, websocket in self.clients.items():
-            if filter_func and not filter_func(client_id):
-                continue
-            
-            try:
-                await websocket.send(json.dumps(data))
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            await self.disconnect_client(client_id)
+        # Serialize once; the same bytes go to every client
+        payload = orjson.dumps(data)
+
+        targets = [
+            client_id for client_id in self.clients
+            if not filter_func or filter_func(client_id)
+        ]
+        await self._send_payload(targets, payload)
     
     async def disconnect_client(self, client_id: str):
         """Disconnect and clean up client"""
@@ -228,43 +275,105 @@ class WebSocketServer:
             del self.clients[client_id]
         
         if client_id in self.subscriptions:
-            del self.subscriptions[client_id]
-        
+            sub = self.subscriptions.pop(client_id)
+            self._drop_routing(client_id, sub.symbols, sub.data_types)
+
         logger.info(f"Client {client_id} disconnected and cleaned up")
+
+    def _drop_routing(self, client_id: str, symbols: Set[str], data_types: Set[str]):
+        """Remove a client from the routing index for the given pairs"""
+        for sym in symbols:
+            for dt in data_types:
+                targets = self._routing.get((sym, dt))
+                if targets is not None:
+                    targets.discard(client_id)
+                    if not targets:
+                        del self._routing[(sym, dt)]
     
     async def _stream_market_data(self):
         """Stream market data to subscribed clients"""
+        rng = random.Random()
+
         while self.running:
             try:
                 # Simulate market data updates (replace with actual data source)
                 await asyncio.sleep(1)  # Update every second
                 
-                # Get market data for all subscribed symbols
-                all_symbols = set()
-                for sub in self.subscriptions.values():
-                    all_symbols.update(sub.symbols)
-                
+                # The routing index already knows which (symbol, data_type)
+                # pairs have subscribers — no per-tick scan of subscriptions
+                all_symbols = {
+                    sym for sym, dt in self._routing if dt == 'quotes'
+                }
+
                 if not all_symbols:
                     continue
                 
-                # Generate market data (replace with actual data)
+                # One timestamp per tick: every symbol in this iteration
+                # shares it, instead of re-formatting utcnow per frame
+                tick_ts = datetime.utcnow().isoformat()
+
+                # Generate market data (replace with actual data). A plain
+                # PRNG draw replaces hashing a freshly concatenated
+                # symbol+timestamp string per symbol per tick
                 for symbol in all_symbols:
-                    market_data = {
-                        'type': 'market_data',
-                        'data_type': 'quote',
-                        'symbol': symbol,
-                        'price': 100 + (hash(symbol + str(datetime.utcnow())) % 100) / 100,
-                        'volume': hash(symbol) % 1000000,
-                        'timestamp': datetime.utcnow().isoformat()
-                    }
-                    
-                    # Send to subscribed clients
-                    await self._send_to_subscribers(symbol, 'quotes', market_data)
+                    if msgspec is not None:
+                        payload = _MARKET_DATA_ENCODER.encode(MarketDataMsg(
+                            type='market_data',
+                            data_type='quote',
+                            symbol=symbol,
+                            price=100 + rng.random(),
+                            volume=hash(symbol) % 1000000,
+                            timestamp=tick_ts
+                        ))
+                    else:
+                        payload = orjson.dumps({
+                            'type': 'market_data',
+                            'data_type': 'quote',
+                            'symbol': symbol,
+                            'price': 100 + rng.random(),
+                            'volume': hash(symbol) % 1000000,
+                            'timestamp': tick_ts
+                        })
+
+                    if self.redis_client:
+                        # Publish once; every server process (this one
+                        # included) delivers to its own local clients
+                        await self.redis_client.publish(f"md:{symbol}", payload)
+                    else:
+                        await self._send_payload(
+                            list(self._routing.get((symbol, 'quotes'), ())),
+                            payload
+                        )
                     
             except Exception as e:
                 logger.error(f"Error streaming market data: {e}")
                 await asyncio.sleep(5)  # Wait before retrying
     
+    async def _consume_market_data_channel(self):
+        """
+        Deliver Redis-published market data to this process's clients.
+
+        Each frame arrives pre-serialized, so delivery is a routing lookup
+        plus the concurrent send — the O(subscribers) work stays in Redis's
+        C fanout and scales across server processes.
+        """
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.psubscribe('md:*')
+
+            async for message in pubsub.listen():
+                if message['type'] != 'pmessage':
+                    continue
+                symbol = message['channel'].decode().split(':', 1)[1]
+                await self._send_payload(
+                    list(self._routing.get((symbol, 'quotes'), ())),
+                    message['data']
+                )
+        except Exception as e:
+            logger.error(f"Redis fanout consumer error: {e}")
+        finally:
+            await pubsub.close()
+
     async def _stream_news(self):
         """Stream news updates to subscribed clients"""
         while self.running:
@@ -272,15 +381,16 @@ class WebSocketServer:
                 # Check for news updates every 30 seconds
                 await asyncio.sleep(30)
                 
-                # Get subscribed symbols for news
-                news_symbols = set()
-                for sub in self.subscriptions.values():
-                    if 'news' in sub.data_types:
-                        news_symbols.update(sub.symbols)
-                
+                # Get subscribed symbols for news from the routing index
+                news_symbols = {
+                    sym for sym, dt in self._routing if dt == 'news'
+                }
+
                 if not news_symbols:
                     continue
                 
+                update_ts = datetime.utcnow().isoformat()
+
                 # Simulate news (replace with actual news source)
                 for symbol in list(news_symbols)[:5]:  # Limit to 5 symbols per update
                     news_data = {
@@ -288,7 +398,7 @@ class WebSocketServer:
                         'symbol': symbol,
                         'headline': f"Breaking: {symbol} announces quarterly results",
                         'summary': f"{symbol} reported strong earnings...",
-                        'timestamp': datetime.utcnow().isoformat()
+                        'timestamp': update_ts
                     }
                     
                     await self._send_to_subscribers(symbol, 'news', news_data)
@@ -299,19 +409,38 @@ class WebSocketServer:
     
     async def _send_to_subscribers(self, symbol: str, data_type: str, data: Dict[str, Any]):
         """Send data to clients subscribed to specific symbol and data type"""
-        disconnected = []
-        
-        for client_id, sub in self.subscriptions.items():
-            if symbol in sub.symbols and data_type in sub.data_types:
-                if client_id in self.clients:
-                    try:
-                        await self.clients[client_id].send(json.dumps(data))
-                    except Exception as e:
-                        logger.error(f"Error sending to {client_id}: {e}")
-                        disconnected.append(client_id)
-        
-        # Clean up disconnected clients
+        # Serialize once; re-encoding the same dict per subscriber made the
+        # fanout cost O(subscribers x payload size)
+        payload = orjson.dumps(data)
+
+        # Routing index lookup is O(matching subscribers), not O(all
+        # subscriptions x symbols)
+        targets = list(self._routing.get((symbol, data_type), ()))
+        await self._send_payload(targets, payload)
+
+    async def _send_payload(self, client_ids: List[str], payload: bytes):
+        """
+        Send pre-serialized bytes to many clients concurrently.
+
+        Sends run in parallel via gather, so one slow consumer delays the
+        fanout by its own latency instead of stalling everyone behind it.
+        """
+        targets = [cid for cid in client_ids if cid in self.clients]
+        if not targets:
+            return
+
+        results = await asyncio.gather(
+            *(self.clients[cid].send(payload) for cid in targets),
+            return_exceptions=True
+        )
+
+        disconnected = [
+            cid for cid, result in zip(targets, results)
+            if isinstance(result, Exception)
+        ]
+
         for client_id in disconnected:
+            logger.error(f"Error sending to {client_id}, disconnecting")
             await self.disconnect_client(client_id)
 
 
@@ -2,8 +2,8 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy import Index, event, text
 import uuid
 
 db = SQLAlchemy()
@@ -57,7 +57,9 @@ class Holding(db.Model):
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     portfolio_id = db.Column(UUID(as_uuid=True), db.ForeignKey('portfolios.id'), nullable=False)
     symbol = db.Column(db.String(20), nullable=False)
-    quantity = db.Column(db.Numeric(20, 8), nullable=False)
+    # Quantities are analytic, not ledger values; float avoids NUMERIC's
+    # software arithmetic (purchase_price stays exact for accounting)
+    quantity = db.Column(db.Float, nullable=False)
     purchase_price = db.Column(db.Numeric(20, 8), nullable=False)
     purchase_date = db.Column(db.DateTime, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -75,15 +77,22 @@ class MarketData(db.Model):
     
     time = db.Column(db.DateTime, primary_key=True)
     symbol = db.Column(db.String(20), primary_key=True)
-    open = db.Column(db.Numeric(20, 8))
-    high = db.Column(db.Numeric(20, 8))
-    low = db.Column(db.Numeric(20, 8))
-    close = db.Column(db.Numeric(20, 8))
+    # double precision, not NUMERIC: sources deliver IEEE-754 doubles
+    # anyway, and fixed 8-byte floats aggregate ~10x faster in Postgres
+    open = db.Column(db.Float)
+    high = db.Column(db.Float)
+    low = db.Column(db.Float)
+    close = db.Column(db.Float)
     volume = db.Column(db.BigInteger)
     source = db.Column(db.String(50))
     
     __table_args__ = (
-        Index('idx_market_data_symbol_time', 'symbol', 'time'),
+        # Matches "latest N bars for symbol" access; descending time so the
+        # scan reads newest entries first without a sort
+        Index('idx_market_data_symbol_time', 'symbol', text('time DESC')),
+        # BRIN suits the append-only, time-ordered inserts: orders of
+        # magnitude smaller than a btree on a monotonic column
+        Index('idx_market_data_time_brin', 'time', postgresql_using='brin'),
     )
 
 
@@ -103,11 +112,81 @@ class NewsArticle(db.Model):
     symbols = db.Column(JSONB)  # List of related symbols
     sentiment = db.Column(db.Float)  # -1 to 1
     categories = db.Column(JSONB)  # List of categories
-    
+    # Generated in the database so text search never re-lexes documents
+    # at query time; /news matches it with @@ plainto_tsquery
+    search_vector = db.Column(
+        TSVECTOR,
+        db.Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))",
+            persisted=True
+        )
+    )
+
     __table_args__ = (
-        Index('idx_news_published', 'published_at'),
-        Index('idx_news_symbols', 'symbols', postgresql_using='gin'),
+        # Covering index for the "latest N headlines" query: the listed
+        # payload columns ride along in the index, so it resolves with an
+        # index-only scan and no heap fetches
+        Index(
+            'idx_news_published',
+            text('published_at DESC'),
+            postgresql_include=['title', 'url', 'source']
+        ),
         Index('idx_news_categories', 'categories', postgresql_using='gin'),
+        # Multi-symbol containment filters in /news still hit the JSONB
+        # column; jsonb_path_ops keeps the GIN index small and fast for
+        # @> (single-symbol lookups use the link table instead)
+        Index(
+            'idx_news_symbols_path',
+            'symbols',
+            postgresql_using='gin',
+            postgresql_ops={'symbols': 'jsonb_path_ops'}
+        ),
+        # Word search resolves against the generated tsvector with one
+        # GIN probe instead of scanning title/content bodies
+        Index('idx_news_search', 'search_vector', postgresql_using='gin'),
+    )
+
+
+class NewsArticleSymbol(db.Model):
+    """
+    Narrow link rows for per-symbol news lookups.
+
+    "Latest news for AAPL" resolves on the (symbol, published_at DESC)
+    btree with bounded-width rows instead of walking the JSONB GIN index
+    and heap-fetching each article. The JSONB symbols column stays on
+    NewsArticle for display.
+    """
+    __tablename__ = 'news_article_symbols'
+
+    article_id = db.Column(
+        UUID(as_uuid=True),
+        db.ForeignKey('news_articles.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    symbol = db.Column(db.String(20), primary_key=True)
+    published_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_news_symbol_time', 'symbol', text('published_at DESC')),
+    )
+
+
+@event.listens_for(NewsArticle, 'after_insert')
+def _index_article_symbols(mapper, connection, article):
+    """Populate the symbol link table whenever an article is inserted"""
+    if not article.symbols:
+        return
+
+    connection.execute(
+        NewsArticleSymbol.__table__.insert(),
+        [
+            {
+                'article_id': article.id,
+                'symbol': symbol,
+                'published_at': article.published_at
+            }
+            for symbol in article.symbols
+        ]
     )
 
 
@@ -126,7 +205,15 @@ class APIRequest(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_api_request_user', 'user_id'),
+        # Usage dashboards filter by user over a recent window; one composite
+        # covering index replaces the two singles (which forced a bitmap AND)
+        # and serves the per-user queries with index-only scans
+        Index(
+            'idx_api_request_user_created',
+            'user_id',
+            text('created_at DESC'),
+            postgresql_include=['endpoint', 'status_code', 'response_time']
+        ),
         Index('idx_api_request_created', 'created_at'),
     )
 
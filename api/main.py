@@ -1,18 +1,22 @@
 # api/main.py
 import asyncio
 import logging
-from flask import Flask, jsonify
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, g, jsonify, request
+from flask.json.provider import JSONProvider
+import orjson
+from sqlalchemy import text
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from prometheus_flask_exporter import PrometheusMetrics
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, Info, generate_latest
 import redis
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from .config import Config
 from .database.models import db, migrate
-from .middleware.auth import auth_bp
+from .middleware.auth import auth_bp, CachedJWTManager
 from .middleware.security import SecurityMiddleware
 from .routes import (
     market_data_bp,
@@ -23,6 +27,7 @@ from .routes import (
     options_bp
 )
 from .utils.cache import CacheManager
+from .data.aggregator import DataAggregator
 from .data.streaming import WebSocketServer
 
 # Configure logging
@@ -36,10 +41,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+# Instrumented directly with prometheus_client instead of
+# prometheus_flask_exporter: the exporter wraps every view and allocates a
+# label tuple per request, while pre-bound histogram children make each
+# observation a single method call.
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by blueprint',
+    labelnames=('route',)
+)
+
+# Liveness probes hammer /health; skip instrumentation there entirely
+_UNTRACKED_PATHS = frozenset(('/health', '/metrics'))
+
+# Compiled once; health checks run it straight on an engine connection,
+# skipping session/transaction setup and per-call text() construction
+_HEALTH_STMT = text('SELECT 1')
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for request parsing and jsonify"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app(config_class=Config):
     """Create and configure the Flask application"""
     app = Flask(__name__)
     app.config.from_object(config_class)
+
+    # orjson parses and serializes several times faster than stdlib json;
+    # every request.get_json and jsonify in the app goes through this
+    app.json = OrjsonProvider(app)
     
     # Security middleware
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
@@ -58,14 +96,23 @@ def create_app(config_class=Config):
     db.init_app(app)
     migrate.init_app(app, db)
     
-    # JWT
-    jwt = JWTManager(app)
+    # JWT (decode results cached briefly; see CachedJWTManager)
+    jwt = CachedJWTManager(app)
     
     # Redis and Cache
     redis_client = redis.from_url(app.config['REDIS_URL'])
     app.redis = redis_client
     app.cache = CacheManager(redis_client)
-    
+
+    # Data aggregator, bound directly on the blueprints that use it: the
+    # routes then read a plain attribute instead of going through the
+    # current_app LocalProxy (a thread-local lookup per access)
+    aggregator = DataAggregator(app.cache, app.config)
+    app.aggregator = aggregator
+    for bp in (market_data_bp, technical_bp, portfolio_bp, news_bp,
+               crypto_bp, options_bp):
+        bp.aggregator = aggregator
+
     # Rate Limiting
     limiter = Limiter(
         app=app,
@@ -77,9 +124,34 @@ def create_app(config_class=Config):
     
     # Prometheus Metrics
     if app.config['PROMETHEUS_ENABLED']:
-        metrics = PrometheusMetrics(app)
-        metrics.info('financial_platform', 'Financial Data Platform', version='1.0.0')
-    
+        Info('financial_platform', 'Financial Data Platform').info({'version': '1.0.0'})
+
+        # Children resolved once at startup so the hot path never does the
+        # label-tuple dict lookup inside labels()
+        route_histograms = {
+            name: REQUEST_LATENCY.labels(route=name)
+            for name in ('auth', 'market_data', 'technical', 'portfolio',
+                         'news', 'crypto', 'options')
+        }
+        default_histogram = REQUEST_LATENCY.labels(route='other')
+
+        @app.before_request
+        def start_request_timer():
+            if request.path not in _UNTRACKED_PATHS:
+                g._request_start = time.perf_counter()
+
+        @app.after_request
+        def record_request_latency(response):
+            start = g.get('_request_start')
+            if start is not None:
+                histogram = route_histograms.get(request.blueprint, default_histogram)
+                histogram.observe(time.perf_counter() - start)
+            return response
+
+        @app.route('/metrics')
+        def metrics():
+            return generate_latest(), 200, {'Content-Type': CONTENT_TYPE_LATEST}
+
     # Register Blueprints
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(market_data_bp, url_prefix='/api/market')
@@ -88,7 +160,12 @@ def create_app(config_class=Config):
     app.register_blueprint(news_bp, url_prefix='/api/news')
     app.register_blueprint(crypto_bp, url_prefix='/api/crypto')
     app.register_blueprint(options_bp, url_prefix='/api/options')
-    
+
+    # The rule set is fixed once the blueprints are in; Werkzeug would
+    # otherwise compile the matcher lazily on the first request, so pay
+    # for it at startup instead
+    app.url_map.update()
+
     # Error Handlers
     @app.errorhandler(400)
     def bad_request(error):
@@ -119,54 +196,75 @@ def create_app(config_class=Config):
         logger.error(f"Internal error: {error}")
         return jsonify({'error': 'Internal server error'}), 500
     
-    # Health Check
+    # Health Check. Liveness probes hit this at high frequency from every
+    # pod, so results are cached briefly and the two checks run in parallel
+    # with a hard timeout instead of stalling the probe on a slow backend.
+    health_cache = {'ts': 0.0, 'body': None, 'code': 503}
+    health_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='health')
+
     @app.route('/health')
     def health_check():
         """Health check endpoint"""
-        try:
-            # Check database
-            db.session.execute('SELECT 1')
-            db_status = 'healthy'
-        except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            db_status = 'unhealthy'
-        
-        try:
-            # Check Redis
-            app.redis.ping()
-            redis_status = 'healthy'
-        except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
-            redis_status = 'unhealthy'
-        
+        now = time.monotonic()
+        if health_cache['body'] is not None and now - health_cache['ts'] < 2.0:
+            return jsonify(health_cache['body']), health_cache['code']
+
+        engine = db.engine
+
+        def check_db():
+            with engine.connect() as conn:
+                conn.execute(_HEALTH_STMT)
+
+        checks = {
+            'database': health_pool.submit(check_db),
+            'redis': health_pool.submit(app.redis.ping)
+        }
+
+        statuses = {}
+        for name, future in checks.items():
+            try:
+                future.result(timeout=0.5)
+                statuses[name] = 'healthy'
+            except Exception as e:
+                logger.error(f"{name.capitalize()} health check failed: {e}")
+                statuses[name] = 'unhealthy'
+
+        healthy = all(s == 'healthy' for s in statuses.values())
         health_status = {
-            'status': 'healthy' if db_status == 'healthy' and redis_status == 'healthy' else 'unhealthy',
-            'database': db_status,
-            'redis': redis_status,
+            'status': 'healthy' if healthy else 'unhealthy',
+            'database': statuses['database'],
+            'redis': statuses['redis'],
             'version': '1.0.0'
         }
-        
-        return jsonify(health_status), 200 if health_status['status'] == 'healthy' else 503
+
+        health_cache['body'] = health_status
+        health_cache['code'] = 200 if healthy else 503
+        health_cache['ts'] = now
+
+        return jsonify(health_status), health_cache['code']
     
-    # API Info
+    # API Info. The payload is constant, so it is serialized exactly once
+    # here instead of rebuilding the dict and re-encoding it per request.
+    api_info_body = orjson.dumps({
+        'name': 'Financial Data Platform API',
+        'version': '1.0.0',
+        'endpoints': {
+            'auth': '/api/auth',
+            'market_data': '/api/market',
+            'technical': '/api/technical',
+            'portfolio': '/api/portfolio',
+            'news': '/api/news',
+            'crypto': '/api/crypto',
+            'options': '/api/options'
+        },
+        'documentation': '/api/docs',
+        'health': '/health'
+    })
+
     @app.route('/api')
     def api_info():
         """API information endpoint"""
-        return jsonify({
-            'name': 'Financial Data Platform API',
-            'version': '1.0.0',
-            'endpoints': {
-                'auth': '/api/auth',
-                'market_data': '/api/market',
-                'technical': '/api/technical',
-                'portfolio': '/api/portfolio',
-                'news': '/api/news',
-                'crypto': '/api/crypto',
-                'options': '/api/options'
-            },
-            'documentation': '/api/docs',
-            'health': '/health'
-        })
+        return app.response_class(api_info_body, mimetype='application/json')
     
     return app
 
@@ -1,22 +1,119 @@
 # api/middleware/auth.py
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import JWTManager, create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from werkzeug.security import generate_password_hash, check_password_hash
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
+import os
 import secrets
+import threading
 import logging
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+
 from ..database.models import db, User
 
 logger = logging.getLogger(__name__)
 
 auth_bp = Blueprint('auth', __name__)
 
+# Argon2id via the C extension: safer and much cheaper per unit of work
+# than Werkzeug's PBKDF2 loop, and it releases the GIL while hashing
+_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Verified whenever the user row is missing, so login latency does not
+# reveal whether an account exists
+_DUMMY_HASH = _hasher.hash(secrets.token_hex(16))
+
+
+def hash_password(password: str) -> str:
+    """Hash a password for storage"""
+    return _hasher.hash(password)
+
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """Verify a password, accepting legacy Werkzeug-format hashes"""
+    try:
+        return _hasher.verify(stored_hash, password)
+    except InvalidHashError:
+        # Hash predates the Argon2 migration
+        return check_password_hash(stored_hash, password)
+    except VerificationError:
+        return False
+
+
+def password_needs_rehash(stored_hash: str) -> bool:
+    """Whether a stored hash should be upgraded to current parameters"""
+    try:
+        return _hasher.check_needs_rehash(stored_hash)
+    except InvalidHashError:
+        # Legacy Werkzeug-format hash
+        return True
+
+# Bounded decode cache: signature verification dominates per-request auth
+# CPU, and hot tokens are re-verified hundreds of times within their
+# lifetime. TTL is well under token expiry, so a revoked-by-expiry token
+# outlives its cache entry by at most the TTL.
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+# Cache misses verify on worker threads: OpenSSL releases the GIL during
+# the signature check, so clustered misses (cold cache, token rollover)
+# verify in parallel instead of serializing on the request worker
+_verify_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 2,
+    thread_name_prefix='jwt-verify'
+)
+
+
+class CachedJWTManager(JWTManager):
+    """JWTManager with a short-TTL cache over token decode/verification"""
+
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor)
+        # Size the decode cache from config so deployments polling cached
+        # dashboards can widen the window without touching code
+        global _token_cache
+        ttl = app.config.get('JWT_DECODE_CACHE_TTL', 30)
+        maxsize = app.config.get('JWT_DECODE_CACHE_MAXSIZE', 10000)
+        with _token_cache_lock:
+            _token_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        if allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        # Digest key bounds per-entry memory regardless of token size
+        key = hashlib.sha256(encoded_token.encode()).digest()[:16]
+
+        with _token_cache_lock:
+            claims = _token_cache.get(key)
+        if claims is not None:
+            return claims
+
+        # Failures propagate uncached so invalid tokens are never served.
+        # The worker thread gets its own app context for config lookups.
+        app = current_app._get_current_object()
+        decode = super()._decode_jwt_from_config
+
+        def _decode_with_context():
+            with app.app_context():
+                return decode(encoded_token, csrf_value, allow_expired)
+
+        claims = _verify_pool.submit(_decode_with_context).result()
+
+        with _token_cache_lock:
+            _token_cache[key] = claims
+        return claims
+
 @auth_bp.route('/register', methods=['POST'])
 def register():
     """Register new user"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         
         # Validate input
         email = data.get('email', '').lower().strip()
@@ -40,7 +137,7 @@ def register():
         user = User(
             email=email,
             username=username,
-            password_hash=generate_password_hash(password),
+            password_hash=hash_password(password),
             api_key=secrets.token_urlsafe(32),
             tier='basic'
         )
@@ -75,27 +172,42 @@ def register():
 def login():
     """Login user"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         username = data.get('username', '').strip()
         password = data.get('password', '')
         
         if not username or not password:
             return jsonify({'error': 'Username and password required'}), 400
         
-        # Find user by username or email
-        user = User.query.filter(
-            db.or_(
-                User.username == username,
-                User.email == username.lower()
-            )
-        ).first()
+        # Find user by username or email. The shape is detectable client-side
+        # ('@' only ever appears in emails), so each login is one indexed
+        # lookup instead of an OR across two indexes.
+        if '@' in username:
+            user = User.query.filter_by(email=username.lower()).first()
+        else:
+            user = User.query.filter_by(username=username).first()
         
-        if not user or not check_password_hash(user.password_hash, password):
+        if user is None:
+            # Burn the same hashing work as a real verification so missing
+            # accounts are not distinguishable by response time
+            try:
+                _hasher.verify(_DUMMY_HASH, password)
+            except VerificationError:
+                pass
+            return jsonify({'error': 'Invalid credentials'}), 401
+
+        if not verify_password(user.password_hash, password):
             return jsonify({'error': 'Invalid credentials'}), 401
         
         if not user.is_active:
             return jsonify({'error': 'Account disabled'}), 403
-        
+
+        # Lazy migration: upgrade legacy Werkzeug hashes (and Argon2 hashes
+        # with outdated parameters) now that the plaintext is in hand
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
+            db.session.commit()
+
         # Create tokens
         access_token = create_access_token(identity=str(user.id))
         refresh_token = create_refresh_token(identity=str(user.id))
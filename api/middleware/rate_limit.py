@@ -4,20 +4,52 @@ from flask import jsonify, g
 from flask_jwt_extended import get_jwt_identity
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+import threading
 import logging
 
+from cachetools import TTLCache
+
 from ..database.models import User
 
 logger = logging.getLogger(__name__)
 
+# Tiers change rarely; a short TTL cache turns the per-request tier lookup
+# from a DB round-trip into a dict hit
+_tier_cache = TTLCache(maxsize=50000, ttl=60)
+_tier_cache_lock = threading.Lock()
+
+
+def invalidate_user_tier(user_id):
+    """Drop a user's cached tier (call after tier changes)"""
+    with _tier_cache_lock:
+        _tier_cache.pop(user_id, None)
+
+
 def get_user_tier():
     """Get current user's tier for rate limiting"""
+    # Repeated decorator stacks within one request reuse the g value
+    tier = g.get('user_tier')
+    if tier is not None:
+        return tier
+
     try:
         user_id = get_jwt_identity()
         if user_id:
-            user = User.query.get(user_id)
-            if user:
-                return user.tier
+            with _tier_cache_lock:
+                tier = _tier_cache.get(user_id)
+            if tier is not None:
+                return tier
+
+            # Select just the tier column; no full-row hydration
+            tier = (
+                User.query.with_entities(User.tier)
+                .filter_by(id=user_id)
+                .scalar()
+            )
+            if tier:
+                with _tier_cache_lock:
+                    _tier_cache[user_id] = tier
+                return tier
     except:
         pass
     return 'basic'
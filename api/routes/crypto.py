@@ -1,17 +1,79 @@
 # api/routes/crypto.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app
 from flask_jwt_extended import jwt_required
 from datetime import datetime, timedelta
+import functools
 import logging
 
+import numpy as np
+import orjson
+from cachetools import TTLCache
+
 from ..utils.validators import validate_crypto_symbol, validate_number, validate_date_range
 from ..utils.decorators import rate_limit_by_tier, validate_request
-from ..utils.cache import cache
+from ..utils.cache import cache, http_cache
+from ..utils.concurrency import gather_limited
+from ..utils.responses import ojsonify
+from ..utils.timestamps import iso_now
 
 logger = logging.getLogger(__name__)
 
+# Trending barely changes between requests; memoizing the serialized bytes
+# per (limit, period, category) skips the fetch, dict build and JSON encode
+_trending_cache = TTLCache(maxsize=16, ttl=30)
+
 crypto_bp = Blueprint('crypto', __name__)
 
+# Top crypto bases cover nearly all traffic, so normalization for them is
+# one dict hit instead of two string scans plus the validation regex
+_KNOWN_BASES = (
+    'BTC', 'ETH', 'BNB', 'SOL', 'XRP', 'ADA', 'DOGE', 'AVAX', 'DOT',
+    'MATIC', 'LINK', 'LTC', 'BCH', 'UNI', 'ATOM', 'XLM', 'ETC', 'FIL',
+    'APT', 'ARB', 'OP', 'NEAR', 'ALGO', 'XMR', 'ZEC', 'DASH', 'AAVE',
+    'MKR', 'SHIB', 'TRX'
+)
+_CRYPTO_NORMALIZE = {f'{base}-USD': f'{base}-USD' for base in _KNOWN_BASES}
+_CRYPTO_NORMALIZE.update({base: f'{base}-USD' for base in _KNOWN_BASES})
+
+# Allowed parameter values, hoisted so membership checks are O(1) set
+# lookups and the 400 messages aren't re-formatted per request
+_VALID_PERIODS = frozenset(('1h', '24h', '7d', '30d'))
+_INVALID_PERIOD_ERROR = "Invalid period. Must be one of ['1h', '24h', '7d', '30d']"
+_VALID_CRYPTO_INTERVALS = frozenset(('15m', '30m', '1h', '4h', '1d', '1w'))
+_INVALID_INTERVAL_ERROR = (
+    "Invalid interval. Must be one of ['15m', '30m', '1h', '4h', '1d', '1w']"
+)
+_VALID_CHAINS = frozenset(
+    ('ethereum', 'bsc', 'polygon', 'avalanche', 'arbitrum', 'optimism')
+)
+_INVALID_CHAIN_ERROR = (
+    "Invalid chain. Must be one of "
+    "['ethereum', 'bsc', 'polygon', 'avalanche', 'arbitrum', 'optimism']"
+)
+_MINABLE = frozenset(('BTC', 'ETH', 'LTC', 'BCH', 'ETC', 'ZEC', 'XMR', 'DASH'))
+
+
+def _normalize_crypto_symbol(symbol: str) -> str:
+    """Normalize a crypto symbol to its -USD pair form"""
+    if not isinstance(symbol, str):
+        raise ValueError("Symbol must be a non-empty string")
+    return _normalize_cached(symbol)
+
+
+# Pure and small-universe, so batches of repeated symbols resolve from
+# the LRU without re-running pair building or the validation regex
+@functools.lru_cache(maxsize=4096)
+def _normalize_cached(symbol: str) -> str:
+    known = _CRYPTO_NORMALIZE.get(symbol.upper())
+    if known is not None:
+        return known
+
+    # Unknown symbol: fall through to the original slow path
+    if '-' not in symbol and not symbol.endswith('USD'):
+        symbol = f"{symbol}-USD"
+    return validate_crypto_symbol(symbol)
+
+
 @crypto_bp.route('/crypto/<symbol>', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
@@ -19,24 +81,21 @@ async def get_crypto_quote(symbol: str):
     """Get cryptocurrency quote"""
     try:
         # Crypto symbols often don't include currency pair
-        if '-' not in symbol and not symbol.endswith('USD'):
-            symbol = f"{symbol}-USD"
-        
-        symbol = validate_crypto_symbol(symbol)
-        
-        aggregator = current_app.aggregator
+        symbol = _normalize_crypto_symbol(symbol)
+
+        aggregator = crypto_bp.aggregator
         crypto_data = await aggregator.get_crypto_data(symbol)
         
         if not crypto_data:
-            return jsonify({'error': f'No data found for {symbol}'}), 404
+            return ojsonify({'error': f'No data found for {symbol}'}), 404
         
-        return jsonify(crypto_data), 200
+        return ojsonify(crypto_data), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting crypto data: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/batch', methods=['POST'])
@@ -45,71 +104,78 @@ async def get_crypto_quote(symbol: str):
 async def get_batch_crypto_quotes():
     """Get multiple cryptocurrency quotes"""
     try:
-        data = request.get_json()
-        symbols = data.get('symbols', [])
-        
-        if not symbols:
-            return jsonify({'error': 'No symbols provided'}), 400
-        
+        data = request.get_json(cache=False, silent=True) or {}
+        symbols = data.get('symbols')
+
+        if not symbols or not isinstance(symbols, list):
+            return ojsonify({'error': 'No symbols provided'}), 400
+
         if len(symbols) > 50:
-            return jsonify({'error': 'Maximum 50 symbols allowed'}), 400
+            return ojsonify({'error': 'Maximum 50 symbols allowed'}), 400
         
-        # Validate and normalize symbols
-        validated_symbols = []
-        for symbol in symbols:
-            if '-' not in symbol and not symbol.endswith('USD'):
-                symbol = f"{symbol}-USD"
-            validated_symbols.append(validate_crypto_symbol(symbol))
+        # Validate and normalize symbols, dropping duplicates so repeated
+        # entries don't trigger repeated upstream fetches
+        validated_symbols = list(dict.fromkeys(
+            _normalize_crypto_symbol(symbol) for symbol in symbols
+        ))
         
-        aggregator = current_app.aggregator
-        
-        # Get quotes in parallel
-        quotes = {}
-        for symbol in validated_symbols:
-            crypto_data = await aggregator.get_crypto_data(symbol)
-            if crypto_data:
-                quotes[symbol] = crypto_data
-        
-        return jsonify({
+        aggregator = crypto_bp.aggregator
+
+        # Get quotes in parallel; sequential awaits would serialize up to
+        # 50 upstream round-trips
+        results = await gather_limited(
+            aggregator.get_crypto_data(symbol) for symbol in validated_symbols
+        )
+        quotes = {
+            symbol: crypto_data
+            for symbol, crypto_data in zip(validated_symbols, results)
+            if crypto_data and not isinstance(crypto_data, Exception)
+        }
+
+        return ojsonify({
             'quotes': quotes,
             'requested': len(validated_symbols),
             'found': len(quotes),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting batch crypto quotes: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/trending', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
-@cache(prefix="crypto_trending", ttl=300)
+@http_cache(ttl=300)
 async def get_trending_crypto():
     """Get trending cryptocurrencies"""
     try:
         limit = min(int(request.args.get('limit', 10)), 50)
         time_period = request.args.get('period', '24h')
         category = request.args.get('category', 'all')
-        
+
         # Validate time period
-        valid_periods = ['1h', '24h', '7d', '30d']
-        if time_period not in valid_periods:
-            return jsonify({'error': f'Invalid period. Must be one of {valid_periods}'}), 400
-        
+        if time_period not in _VALID_PERIODS:
+            return ojsonify({'error': _INVALID_PERIOD_ERROR}), 400
+
+        cache_key = (limit, time_period, category)
+        body = _trending_cache.get(cache_key)
+        if body is not None:
+            return current_app.response_class(body, mimetype='application/json'), 200
+
         # Get trending data from aggregator
-        aggregator = current_app.aggregator
-        
+        aggregator = crypto_bp.aggregator
+
         # This would connect to a service that tracks trending cryptos
         trending_data = await aggregator.get_trending_crypto(
             limit=limit,
             period=time_period,
             category=category
         )
-        
+
         if not trending_data:
             # Fallback to mock data
             trending_data = [
@@ -117,17 +183,20 @@ async def get_trending_crypto():
                 {'symbol': 'ETH-USD', 'name': 'Ethereum', 'change_24h': 3.8, 'volume_24h': 15000000000},
                 {'symbol': 'BNB-USD', 'name': 'Binance Coin', 'change_24h': 2.1, 'volume_24h': 1200000000}
             ]
-        
-        return jsonify({
+
+        body = orjson.dumps({
             'trending': trending_data[:limit],
             'period': time_period,
             'category': category,
-            'timestamp': datetime.utcnow().isoformat()
-        }), 200
-        
+            'timestamp': iso_now()
+        })
+        _trending_cache[cache_key] = body
+
+        return current_app.response_class(body, mimetype='application/json'), 200
+
     except Exception as e:
         logger.error(f"Error getting trending crypto: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/<symbol>/orderbook', methods=['GET'])
@@ -140,7 +209,7 @@ async def get_crypto_orderbook(symbol: str):
         depth = min(int(request.args.get('depth', 20)), 100)
         exchange = request.args.get('exchange', 'aggregate')
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get order book data
         orderbook = await aggregator.get_crypto_orderbook(
@@ -150,30 +219,45 @@ async def get_crypto_orderbook(symbol: str):
         )
         
         if not orderbook:
-            return jsonify({'error': f'No orderbook data for {symbol}'}), 404
+            return ojsonify({'error': f'No orderbook data for {symbol}'}), 404
         
         # Calculate spread and other metrics
         if orderbook.get('bids') and orderbook.get('asks'):
-            best_bid = orderbook['bids'][0]['price']
-            best_ask = orderbook['asks'][0]['price']
+            bids = orderbook['bids']
+            asks = orderbook['asks']
+            best_bid = bids[0]['price']
+            best_ask = asks[0]['price']
             spread = best_ask - best_bid
             spread_pct = (spread / best_ask) * 100
-            
+
+            # Depth sums run as single C loops over float arrays instead
+            # of per-element dict dispatch at depth 100+
+            bid_sizes = np.fromiter(
+                (bid['size'] for bid in bids), dtype=np.float64, count=len(bids)
+            )
+            ask_sizes = np.fromiter(
+                (ask['size'] for ask in asks), dtype=np.float64, count=len(asks)
+            )
+            bid_depth = float(bid_sizes.sum())
+            ask_depth = float(ask_sizes.sum())
+            total_depth = bid_depth + ask_depth
+
             orderbook['metrics'] = {
                 'spread': spread,
                 'spread_percentage': spread_pct,
                 'mid_price': (best_bid + best_ask) / 2,
-                'bid_depth': sum(bid['size'] for bid in orderbook['bids']),
-                'ask_depth': sum(ask['size'] for ask in orderbook['asks'])
+                'bid_depth': bid_depth,
+                'ask_depth': ask_depth,
+                'depth_imbalance': bid_depth / total_depth if total_depth else 0.5
             }
         
-        return jsonify(orderbook), 200
+        return ojsonify(orderbook), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting orderbook: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/<symbol>/trades', methods=['GET'])
@@ -185,43 +269,52 @@ async def get_crypto_trades(symbol: str):
         symbol = validate_crypto_symbol(symbol)
         limit = min(int(request.args.get('limit', 100)), 1000)
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get recent trades
         trades = await aggregator.get_crypto_trades(symbol, limit)
         
         if not trades:
-            return jsonify({'error': f'No trade data for {symbol}'}), 404
+            return ojsonify({'error': f'No trade data for {symbol}'}), 404
         
-        # Calculate trade statistics
+        # Calculate trade statistics in one pass: three separate sums
+        # would touch every trade dict three times at limit=1000
         if trades:
-            total_volume = sum(t['size'] for t in trades)
-            buy_volume = sum(t['size'] for t in trades if t.get('side') == 'buy')
-            sell_volume = sum(t['size'] for t in trades if t.get('side') == 'sell')
-            
+            total_volume = 0.0
+            buy_volume = 0.0
+            sell_volume = 0.0
+            for trade in trades:
+                size = trade['size']
+                total_volume += size
+                side = trade.get('side')
+                if side == 'buy':
+                    buy_volume += size
+                elif side == 'sell':
+                    sell_volume += size
+
             stats = {
                 'total_trades': len(trades),
                 'total_volume': total_volume,
                 'buy_volume': buy_volume,
                 'sell_volume': sell_volume,
                 'buy_sell_ratio': buy_volume / sell_volume if sell_volume > 0 else float('inf'),
-                'avg_trade_size': total_volume / len(trades) if trades else 0
+                'avg_trade_size': total_volume / len(trades)
             }
         else:
             stats = {}
         
-        return jsonify({
+        return ojsonify({
             'symbol': symbol,
             'trades': trades,
             'statistics': stats,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting trades: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/defi/<protocol>', methods=['GET'])
@@ -234,19 +327,19 @@ async def get_defi_metrics(protocol: str):
         protocol = protocol.lower().strip()
         chain = request.args.get('chain', 'all')
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get DeFi metrics
         metrics = await aggregator.get_defi_metrics(protocol, chain)
         
         if not metrics:
-            return jsonify({'error': f'No data for protocol {protocol}'}), 404
+            return ojsonify({'error': f'No data for protocol {protocol}'}), 404
         
-        return jsonify(metrics), 200
+        return ojsonify(metrics), 200
         
     except Exception as e:
         logger.error(f"Error getting DeFi metrics: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/mining/<coin>', methods=['GET'])
@@ -259,11 +352,10 @@ async def get_mining_stats(coin: str):
         coin = coin.upper().strip()
         
         # Only certain coins have mining
-        minable_coins = ['BTC', 'ETH', 'LTC', 'BCH', 'ETC', 'ZEC', 'XMR', 'DASH']
-        if coin not in minable_coins:
-            return jsonify({'error': f'{coin} is not a minable cryptocurrency'}), 400
+        if coin not in _MINABLE:
+            return ojsonify({'error': f'{coin} is not a minable cryptocurrency'}), 400
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get mining statistics
         mining_stats = await aggregator.get_mining_stats(coin)
@@ -285,16 +377,17 @@ async def get_mining_stats(coin: str):
                 }
             }
         
-        return jsonify(mining_stats), 200
+        return ojsonify(mining_stats), 200
         
     except Exception as e:
         logger.error(f"Error getting mining stats: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/exchange-rates', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
+@http_cache(ttl=60)
 @cache(prefix="exchange_rates", ttl=60)
 async def get_exchange_rates():
     """Get cryptocurrency exchange rates across different pairs"""
@@ -305,35 +398,40 @@ async def get_exchange_rates():
         if not quotes:
             quotes = ['BTC', 'ETH', 'EUR', 'GBP', 'JPY']
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
-        # Get exchange rates
+        # Partition the pairs, then resolve all crypto pairs in one
+        # concurrent burst instead of one awaited round-trip per quote
         rates = {}
+        crypto_quotes = []
         for quote in quotes:
             if base == quote:
                 rates[quote] = 1.0
-                continue
-                
-            # Try crypto pairs first
-            if base in ['BTC', 'ETH'] or quote in ['BTC', 'ETH']:
-                pair = f"{base}-{quote}"
-                data = await aggregator.get_crypto_data(pair)
-                if data:
-                    rates[quote] = data.get('price', 0)
+            elif base in ('BTC', 'ETH') or quote in ('BTC', 'ETH'):
+                crypto_quotes.append(quote)
             else:
                 # For fiat pairs, would use forex data
                 # Mock for now
                 rates[quote] = 1.0
+
+        if crypto_quotes:
+            results = await gather_limited(
+                aggregator.get_crypto_data(f"{base}-{quote}")
+                for quote in crypto_quotes
+            )
+            for quote, data in zip(crypto_quotes, results):
+                if data and not isinstance(data, Exception):
+                    rates[quote] = data.get('price', 0)
         
-        return jsonify({
+        return ojsonify({
             'base': base,
             'rates': rates,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }), 200
         
     except Exception as e:
         logger.error(f"Error getting exchange rates: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/<symbol>/technical', methods=['GET'])
@@ -350,11 +448,10 @@ async def get_crypto_technical_analysis(symbol: str):
             indicators = ['sma', 'ema', 'rsi', 'macd', 'bollinger']
         
         # Validate interval
-        valid_intervals = ['15m', '30m', '1h', '4h', '1d', '1w']
-        if interval not in valid_intervals:
-            return jsonify({'error': f'Invalid interval. Must be one of {valid_intervals}'}), 400
+        if interval not in _VALID_CRYPTO_INTERVALS:
+            return ojsonify({'error': _INVALID_INTERVAL_ERROR}), 400
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get historical data for calculations
         end_date = datetime.utcnow()
@@ -365,7 +462,7 @@ async def get_crypto_technical_analysis(symbol: str):
         )
         
         if not historical:
-            return jsonify({'error': f'No historical data for {symbol}'}), 404
+            return ojsonify({'error': f'No historical data for {symbol}'}), 404
         
         # Calculate technical indicators
         # (In production, this would use the technical indicators service)
@@ -377,40 +474,43 @@ async def get_crypto_technical_analysis(symbol: str):
             'signals': {}
         }
         
-        # Add calculated indicators (simplified)
+        # Add calculated indicators (simplified). Closes are extracted into
+        # one float array and the SMA/RSI bundle is fused into a single pass.
+        closes = extract_closes(historical)
+        bundle = calculate_indicator_bundle(closes)
         if 'sma' in indicators:
-            technical_data['indicators']['sma_20'] = calculate_sma(historical, 20)
-            technical_data['indicators']['sma_50'] = calculate_sma(historical, 50)
-        
+            technical_data['indicators']['sma_20'] = bundle['sma_20']
+            technical_data['indicators']['sma_50'] = bundle['sma_50']
+
         if 'rsi' in indicators:
-            technical_data['indicators']['rsi'] = calculate_rsi(historical, 14)
+            technical_data['indicators']['rsi'] = bundle['rsi']
         
         # Generate trading signals
         technical_data['signals'] = generate_crypto_signals(technical_data['indicators'])
         
-        return jsonify(technical_data), 200
+        return ojsonify(technical_data), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting crypto technical analysis: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @crypto_bp.route('/crypto/gas-tracker', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
+@http_cache(ttl=30)
 @cache(prefix="gas_tracker", ttl=30)
 async def get_gas_tracker():
     """Get gas prices for Ethereum and other EVM chains"""
     try:
         chain = request.args.get('chain', 'ethereum').lower()
         
-        valid_chains = ['ethereum', 'bsc', 'polygon', 'avalanche', 'arbitrum', 'optimism']
-        if chain not in valid_chains:
-            return jsonify({'error': f'Invalid chain. Must be one of {valid_chains}'}), 400
+        if chain not in _VALID_CHAINS:
+            return ojsonify({'error': _INVALID_CHAIN_ERROR}), 400
         
-        aggregator = current_app.aggregator
+        aggregator = crypto_bp.aggregator
         
         # Get gas prices
         gas_data = await aggregator.get_gas_prices(chain)
@@ -431,53 +531,82 @@ async def get_gas_tracker():
                 'last_block': 18500000
             }
         
-        return jsonify(gas_data), 200
+        return ojsonify(gas_data), 200
         
     except Exception as e:
         logger.error(f"Error getting gas prices: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 # Helper functions
 
-def calculate_sma(data, period):
+def extract_closes(data) -> np.ndarray:
+    """Extract closing prices once into a float array for indicator reuse"""
+    return np.fromiter((d['close'] for d in data), dtype=np.float64, count=len(data))
+
+
+def calculate_sma(data, period, closes: np.ndarray = None):
     """Calculate Simple Moving Average"""
-    if len(data) < period:
+    if closes is None:
+        closes = extract_closes(data)
+    if closes.size < period:
         return None
-    
-    prices = [d['close'] for d in data[-period:]]
-    return sum(prices) / period
 
+    return float(closes[-period:].mean())
+
+
+def calculate_indicator_bundle(closes: np.ndarray) -> dict:
+    """Compute SMA-20, SMA-50 and RSI-14 fused over one close array.
+
+    A single zero-prefixed cumulative sum yields both moving averages as
+    window-sum differences, and RSI derives its losses from the same gain
+    array (losses == gains - diffs elementwise), so the closes are walked
+    once instead of once per indicator.
+    """
+    bundle = {'sma_20': None, 'sma_50': None, 'rsi': None}
+
+    csum = np.concatenate(([0.0], np.cumsum(closes)))
+    if closes.size >= 20:
+        bundle['sma_20'] = float((csum[-1] - csum[-21]) / 20)
+    if closes.size >= 50:
+        bundle['sma_50'] = float((csum[-1] - csum[-51]) / 50)
 
-def calculate_rsi(data, period=14):
+    if closes.size >= 15:
+        diffs = np.diff(closes[-15:])
+        gains = np.where(diffs > 0, diffs, 0.0)
+        avg_gain = gains.sum() / 14
+        avg_loss = (gains - diffs).sum() / 14
+
+        if avg_loss == 0:
+            bundle['rsi'] = 100
+        else:
+            rs = avg_gain / avg_loss
+            bundle['rsi'] = round(float(100 - (100 / (1 + rs))), 2)
+
+    return bundle
+
+
+def calculate_rsi(data, period=14, closes: np.ndarray = None):
     """Calculate RSI"""
-    if len(data) < period + 1:
+    if closes is None:
+        closes = extract_closes(data)
+    if closes.size < period + 1:
         return None
-    
-    prices = [d['close'] for d in data[-(period+1):]]
-    
-    gains = []
-    losses = []
-    
-    for i in range(1, len(prices)):
-        diff = prices[i] - prices[i-1]
-        if diff > 0:
-            gains.append(diff)
-            losses.append(0)
-        else:
-            gains.append(0)
-            losses.append(abs(diff))
-    
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-    
+
+    diffs = np.diff(closes[-(period + 1):])
+    gains = np.where(diffs > 0, diffs, 0.0)
+    losses = np.where(diffs < 0, -diffs, 0.0)
+
+    avg_gain = gains.sum() / period
+    avg_loss = losses.sum() / period
+
     if avg_loss == 0:
         return 100
-    
+
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
-    
-    return round(rsi, 2)
+
+    return round(float(rsi), 2)
 
 
 def generate_crypto_signals(indicators):
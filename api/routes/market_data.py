@@ -1,17 +1,76 @@
 # api/routes/market_data.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from collections import defaultdict
 from datetime import datetime, timedelta
+import bisect
 import logging
 
+import orjson
+
 from ..utils.validators import validate_symbol, validate_date_range
 from ..utils.decorators import rate_limit_by_tier, validate_request
+from ..utils.responses import ojsonify
+from ..utils.timestamps import iso_now
 from ..data.aggregator import DataAggregator
 
 logger = logging.getLogger(__name__)
 
 market_data_bp = Blueprint('market_data', __name__)
 
+# 90 days of minute bars is ~130k rows; materializing and encoding that
+# in one response blocks the worker and spikes memory, so ranges are
+# capped and large results page through a cursor or stream as NDJSON
+_MAX_HISTORICAL_ROWS = 50000
+_HISTORICAL_PAGE_LIMIT = 5000
+_INTERVAL_MINUTES = {
+    '1m': 1, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '1d': 1440, '1w': 10080, '1M': 43200
+}
+_VALID_INTERVALS = frozenset(_INTERVAL_MINUTES)
+_INVALID_INTERVAL_ERROR = (
+    "Invalid interval. Must be one of "
+    "['1m', '5m', '15m', '30m', '1h', '1d', '1w', '1M']"
+)
+
+# Static seed catalog for /search, indexed at import: ticker prefixes
+# resolve with two bisects over the sorted symbol column, and name words
+# through an inverted token index — O(|query| + hits) per lookup instead
+# of a scan, which holds up when a real listing feed replaces the seed.
+_SYMBOL_CATALOG = sorted([
+    {'symbol': 'AAPL', 'name': 'Apple Inc.', 'type': 'stock'},
+    {'symbol': 'AMD', 'name': 'Advanced Micro Devices Inc.', 'type': 'stock'},
+    {'symbol': 'AMZN', 'name': 'Amazon.com Inc.', 'type': 'stock'},
+    {'symbol': 'BAC', 'name': 'Bank of America Corporation', 'type': 'stock'},
+    {'symbol': 'BRK-B', 'name': 'Berkshire Hathaway Inc.', 'type': 'stock'},
+    {'symbol': 'DIS', 'name': 'The Walt Disney Company', 'type': 'stock'},
+    {'symbol': 'GOOGL', 'name': 'Alphabet Inc.', 'type': 'stock'},
+    {'symbol': 'INTC', 'name': 'Intel Corporation', 'type': 'stock'},
+    {'symbol': 'JNJ', 'name': 'Johnson & Johnson', 'type': 'stock'},
+    {'symbol': 'JPM', 'name': 'JPMorgan Chase & Co.', 'type': 'stock'},
+    {'symbol': 'KO', 'name': 'The Coca-Cola Company', 'type': 'stock'},
+    {'symbol': 'MA', 'name': 'Mastercard Incorporated', 'type': 'stock'},
+    {'symbol': 'META', 'name': 'Meta Platforms Inc.', 'type': 'stock'},
+    {'symbol': 'MSFT', 'name': 'Microsoft Corporation', 'type': 'stock'},
+    {'symbol': 'NFLX', 'name': 'Netflix Inc.', 'type': 'stock'},
+    {'symbol': 'NVDA', 'name': 'NVIDIA Corporation', 'type': 'stock'},
+    {'symbol': 'PG', 'name': 'The Procter & Gamble Company', 'type': 'stock'},
+    {'symbol': 'SPY', 'name': 'SPDR S&P 500 ETF Trust', 'type': 'etf'},
+    {'symbol': 'QQQ', 'name': 'Invesco QQQ Trust', 'type': 'etf'},
+    {'symbol': 'TSLA', 'name': 'Tesla Inc.', 'type': 'stock'},
+    {'symbol': 'UNH', 'name': 'UnitedHealth Group Incorporated', 'type': 'stock'},
+    {'symbol': 'V', 'name': 'Visa Inc.', 'type': 'stock'},
+    {'symbol': 'WMT', 'name': 'Walmart Inc.', 'type': 'stock'},
+    {'symbol': 'XOM', 'name': 'Exxon Mobil Corporation', 'type': 'stock'},
+], key=lambda row: row['symbol'])
+_CATALOG_SYMBOLS = [row['symbol'] for row in _SYMBOL_CATALOG]
+
+_NAME_TOKEN_INDEX = defaultdict(list)
+for _i, _row in enumerate(_SYMBOL_CATALOG):
+    for _token in _row['name'].lower().replace('.', '').replace(',', '').split():
+        _NAME_TOKEN_INDEX[_token].append(_i)
+_NAME_TOKENS = sorted(_NAME_TOKEN_INDEX)
+
 @market_data_bp.route('/quote/<symbol>', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
@@ -23,21 +82,21 @@ async def get_quote(symbol: str):
         symbol = validate_symbol(symbol)
         
         # Get aggregator
-        aggregator: DataAggregator = current_app.aggregator
+        aggregator: DataAggregator = market_data_bp.aggregator
         
         # Get quote
         quote = await aggregator.get_quote(symbol)
         
         if not quote:
-            return jsonify({'error': f'No data found for symbol {symbol}'}), 404
+            return ojsonify({'error': f'No data found for symbol {symbol}'}), 404
         
-        return jsonify(quote), 200
+        return ojsonify(quote), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting quote for {symbol}: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @market_data_bp.route('/quotes', methods=['POST'])
@@ -47,40 +106,37 @@ async def get_quote(symbol: str):
 async def get_batch_quotes():
     """Get quotes for multiple symbols"""
     try:
-        data = request.get_json()
-        symbols = data.get('symbols', [])
-        
-        if not symbols:
-            return jsonify({'error': 'No symbols provided'}), 400
-        
+        data = request.get_json(cache=False, silent=True) or {}
+        symbols = data.get('symbols')
+
+        if not symbols or not isinstance(symbols, list):
+            return ojsonify({'error': 'No symbols provided'}), 400
+
         if len(symbols) > 100:
-            return jsonify({'error': 'Maximum 100 symbols allowed'}), 400
+            return ojsonify({'error': 'Maximum 100 symbols allowed'}), 400
         
-        # Validate all symbols
-        validated_symbols = [validate_symbol(s) for s in symbols]
+        # Validate all symbols, dropping duplicates
+        validated_symbols = list(dict.fromkeys(validate_symbol(s) for s in symbols))
         
         # Get aggregator
-        aggregator: DataAggregator = current_app.aggregator
-        
-        # Get quotes in parallel
-        quotes = {}
-        for symbol in validated_symbols:
-            quote = await aggregator.get_quote(symbol)
-            if quote:
-                quotes[symbol] = quote
-        
-        return jsonify({
+        aggregator: DataAggregator = market_data_bp.aggregator
+
+        # Bulk fetch: cache hits come back in one MGET, misses fan out
+        # concurrently instead of serializing up to 100 round-trips
+        quotes = await aggregator.get_quotes(validated_symbols)
+
+        return ojsonify({
             'quotes': quotes,
             'requested': len(validated_symbols),
             'found': len(quotes),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting batch quotes: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @market_data_bp.route('/historical/<symbol>', methods=['GET'])
@@ -102,33 +158,70 @@ async def get_historical(symbol: str):
         start, end = validate_date_range(start_date, end_date)
         
         # Validate interval
-        valid_intervals = ['1m', '5m', '15m', '30m', '1h', '1d', '1w', '1M']
-        if interval not in valid_intervals:
-            return jsonify({'error': f'Invalid interval. Must be one of {valid_intervals}'}), 400
-        
+        if interval not in _VALID_INTERVALS:
+            return ojsonify({'error': _INVALID_INTERVAL_ERROR}), 400
+
+        # Reject ranges whose row count would produce a multi-MB payload
+        estimated_rows = (end - start).total_seconds() / 60 / _INTERVAL_MINUTES[interval]
+        if estimated_rows > _MAX_HISTORICAL_ROWS:
+            return ojsonify({
+                'error': f'Range too large for interval {interval}: '
+                         f'~{int(estimated_rows)} rows exceeds {_MAX_HISTORICAL_ROWS}. '
+                         'Narrow the date range or use a coarser interval.'
+            }), 400
+
         # Get aggregator
-        aggregator: DataAggregator = current_app.aggregator
-        
+        aggregator: DataAggregator = market_data_bp.aggregator
+
         # Get historical data
         data = await aggregator.get_historical(symbol, start, end, interval)
-        
+
         if not data:
-            return jsonify({'error': f'No historical data found for {symbol}'}), 404
-        
-        return jsonify({
+            return ojsonify({'error': f'No historical data found for {symbol}'}), 404
+
+        # Stream row-per-line when the client asks for NDJSON: rows go out
+        # as encoded instead of one monolithic list allocation
+        if 'application/x-ndjson' in request.headers.get('Accept', ''):
+            def generate():
+                for row in data:
+                    yield orjson.dumps(row) + b'\n'
+
+            return current_app.response_class(
+                generate(), mimetype='application/x-ndjson'
+            )
+
+        # Cursor pagination for the JSON path. ISO-8601 timestamps compare
+        # lexicographically, so the cursor is the last timestamp seen.
+        cursor = request.args.get('cursor')
+        page_limit = min(
+            int(request.args.get('limit', _HISTORICAL_PAGE_LIMIT)),
+            _HISTORICAL_PAGE_LIMIT
+        )
+
+        page = data
+        if cursor:
+            page = [row for row in data if row['timestamp'] > cursor]
+
+        next_cursor = None
+        if len(page) > page_limit:
+            page = page[:page_limit]
+            next_cursor = page[-1]['timestamp']
+
+        return ojsonify({
             'symbol': symbol,
             'interval': interval,
             'start_date': start.isoformat(),
             'end_date': end.isoformat(),
-            'data': data,
-            'count': len(data)
+            'data': page,
+            'count': len(page),
+            'next_cursor': next_cursor
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting historical data: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @market_data_bp.route('/search', methods=['GET'])
@@ -141,25 +234,31 @@ async def search_symbols():
         limit = min(int(request.args.get('limit', 10)), 50)
         
         if not query:
-            return jsonify({'error': 'Search query required'}), 400
-        
-        # TODO: Implement symbol search
-        # For now, return mock results
-        results = [
-            {'symbol': 'AAPL', 'name': 'Apple Inc.', 'type': 'stock'},
-            {'symbol': 'GOOGL', 'name': 'Alphabet Inc.', 'type': 'stock'},
-            {'symbol': 'MSFT', 'name': 'Microsoft Corporation', 'type': 'stock'}
-        ]
-        
-        # Filter by query
-        filtered = [r for r in results if query.upper() in r['symbol'] or query.lower() in r['name'].lower()]
-        
-        return jsonify({
+            return ojsonify({'error': 'Search query required'}), 400
+
+        # Ticker-prefix hits: the catalog entries sorted between the
+        # query and its upper bound all start with it
+        q_upper = query.upper()
+        lo = bisect.bisect_left(_CATALOG_SYMBOLS, q_upper)
+        hi = bisect.bisect_right(_CATALOG_SYMBOLS, q_upper + '\uffff')
+        hits = dict.fromkeys(range(lo, hi))
+
+        # Name-word hits via the inverted token index, prefix-matched the
+        # same way over the sorted token list
+        q_lower = query.lower()
+        t_lo = bisect.bisect_left(_NAME_TOKENS, q_lower)
+        t_hi = bisect.bisect_right(_NAME_TOKENS, q_lower + '\uffff')
+        for token in _NAME_TOKENS[t_lo:t_hi]:
+            hits.update(dict.fromkeys(_NAME_TOKEN_INDEX[token]))
+
+        results = [_SYMBOL_CATALOG[i] for i in sorted(hits)]
+
+        return ojsonify({
             'query': query,
-            'results': filtered[:limit],
-            'count': len(filtered)
+            'results': results[:limit],
+            'count': len(results)
         }), 200
         
     except Exception as e:
         logger.error(f"Error searching symbols: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
+        return ojsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
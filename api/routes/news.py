@@ -1,16 +1,25 @@
 # api/routes/news.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app
 from flask_jwt_extended import jwt_required
 from datetime import datetime, timedelta
+import logging
 
-from ..database.models import db, NewsArticle
+from sqlalchemy import func
+from sqlalchemy.orm import load_only
+
+from ..database.models import db, NewsArticle, NewsArticleSymbol
+from ..utils.decorators import rate_limit_by_tier
+from ..utils.validators import validate_symbol
+from ..utils.responses import ojsonify
+
+logger = logging.getLogger(__name__)
 
 news_bp = Blueprint('news', __name__)
 
 @news_bp.route('/news', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
-async def get_news():
+def get_news():
     """Get news articles"""
     try:
         # Get parameters
@@ -22,7 +31,16 @@ async def get_news():
         # Build query
         since = datetime.utcnow() - timedelta(hours=hours_back)
         
-        db_query = NewsArticle.query.filter(
+        # content is searched but never returned; skip hydrating it
+        db_query = NewsArticle.query.options(
+            load_only(
+                NewsArticle.id, NewsArticle.title, NewsArticle.summary,
+                NewsArticle.url, NewsArticle.source, NewsArticle.author,
+                NewsArticle.published_at, NewsArticle.retrieved_at,
+                NewsArticle.symbols, NewsArticle.sentiment,
+                NewsArticle.categories
+            )
+        ).filter(
             NewsArticle.published_at >= since
         )
         
@@ -33,12 +51,11 @@ async def get_news():
             )
         
         if query:
-            # Search in title and content
-            search_filter = f"%{query}%"
+            # Word search against the generated tsvector: one GIN probe
+            # instead of wildcard ILIKE scans over title and content
             db_query = db_query.filter(
-                db.or_(
-                    NewsArticle.title.ilike(search_filter),
-                    NewsArticle.content.ilike(search_filter)
+                NewsArticle.search_vector.op('@@')(
+                    func.plainto_tsquery('english', query)
                 )
             )
         
@@ -47,7 +64,7 @@ async def get_news():
             NewsArticle.published_at.desc()
         ).limit(limit).all()
         
-        return jsonify({
+        return ojsonify({
             'articles': [
                 {
                     'id': str(article.id),
@@ -56,8 +73,10 @@ async def get_news():
                     'url': article.url,
                     'source': article.source,
                     'author': article.author,
-                    'published_at': article.published_at.isoformat(),
-                    'retrieved_at': article.retrieved_at.isoformat(),
+                    # Naive datetimes pass straight through: orjson formats
+                    # them in C, identical to isoformat() per row
+                    'published_at': article.published_at,
+                    'retrieved_at': article.retrieved_at,
                     'symbols': article.symbols,
                     'sentiment': article.sentiment,
                     'categories': article.categories
@@ -72,76 +91,91 @@ async def get_news():
         
     except Exception as e:
         logger.error(f"Error getting news: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @news_bp.route('/news/sentiment/<symbol>', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
-async def get_sentiment_analysis(symbol: str):
+def get_sentiment_analysis(symbol: str):
     """Get sentiment analysis for a symbol"""
     try:
         symbol = validate_symbol(symbol)
         days_back = int(request.args.get('days', 7))
         
         since = datetime.utcnow() - timedelta(days=days_back)
-        
-        # Get articles for symbol
-        articles = NewsArticle.query.filter(
-            NewsArticle.published_at >= since,
-            NewsArticle.symbols.contains([symbol])
-        ).all()
-        
-        if not articles:
-            return jsonify({
+
+        # Single-symbol lookups resolve on the link table's
+        # (symbol, published_at) btree instead of JSONB containment —
+        # the jsonb_path_ops GIN index only serves @>, and a btree probe
+        # beats it for one symbol anyway
+        symbol_join = (
+            NewsArticleSymbol.article_id == NewsArticle.id,
+        )
+        symbol_filter = (
+            NewsArticleSymbol.symbol == symbol,
+            NewsArticleSymbol.published_at >= since
+        )
+
+        # Aggregate in the database: one row of stats instead of pulling
+        # every article body over the wire to count them in Python
+        avg_sentiment, positive, negative, scored, total = db.session.query(
+            func.avg(NewsArticle.sentiment),
+            func.count(NewsArticle.id).filter(NewsArticle.sentiment > 0.2),
+            func.count(NewsArticle.id).filter(NewsArticle.sentiment < -0.2),
+            func.count(NewsArticle.sentiment),
+            func.count(NewsArticle.id)
+        ).join(NewsArticleSymbol, *symbol_join).filter(*symbol_filter).one()
+
+        if not total:
+            return ojsonify({
                 'symbol': symbol,
                 'sentiment': 0,
                 'articles_analyzed': 0,
                 'period_days': days_back
             }), 200
-        
-        # Calculate sentiment metrics
-        sentiments = [a.sentiment for a in articles if a.sentiment is not None]
-        
-        if not sentiments:
-            avg_sentiment = 0
-        else:
-            avg_sentiment = sum(sentiments) / len(sentiments)
-        
-        # Sentiment distribution
-        positive = len([s for s in sentiments if s > 0.2])
-        negative = len([s for s in sentiments if s < -0.2])
-        neutral = len(sentiments) - positive - negative
-        
-        return jsonify({
+
+        avg_sentiment = float(avg_sentiment) if avg_sentiment is not None else 0
+        neutral = scored - positive - negative
+
+        # Headlines are a separate narrow query: three columns, five rows
+        headlines = NewsArticle.query.with_entities(
+            NewsArticle.title,
+            NewsArticle.sentiment,
+            NewsArticle.published_at
+        ).join(NewsArticleSymbol, *symbol_join).filter(*symbol_filter).order_by(
+            NewsArticleSymbol.published_at.desc()
+        ).limit(5).all()
+
+        return ojsonify({
             'symbol': symbol,
             'overall_sentiment': avg_sentiment,
             'sentiment_score': _calculate_sentiment_score(avg_sentiment),
-            'articles_analyzed': len(articles),
+            'articles_analyzed': total,
             'sentiment_distribution': {
                 'positive': positive,
                 'neutral': neutral,
                 'negative': negative,
-                'positive_percent': (positive / len(sentiments) * 100) if sentiments else 0,
-                'neutral_percent': (neutral / len(sentiments) * 100) if sentiments else 0,
-                'negative_percent': (negative / len(sentiments) * 100) if sentiments else 0
+                'positive_percent': (positive / scored * 100) if scored else 0,
+                'neutral_percent': (neutral / scored * 100) if scored else 0,
+                'negative_percent': (negative / scored * 100) if scored else 0
             },
             'recent_headlines': [
                 {
-                    'title': a.title,
-                    'sentiment': a.sentiment,
-                    'published_at': a.published_at.isoformat()
+                    'title': title,
+                    'sentiment': sentiment,
+                    'published_at': published_at
                 }
-                for a in sorted(articles, key=lambda x: x.published_at, reverse=True)[:5]
+                for title, sentiment, published_at in headlines
             ],
             'period_days': days_back
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error analyzing sentiment: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 def _calculate_sentiment_score(sentiment: float) -> str:
@@ -1,5 +1,6 @@
 # api/routes/options.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app, stream_with_context
+import orjson
 from flask_jwt_extended import jwt_required
 import numpy as np
 from datetime import datetime, timedelta
@@ -8,15 +9,23 @@ import logging
 
 from ..utils.validators import validate_symbol, validate_date, validate_number
 from ..utils.decorators import rate_limit_by_tier, validate_request
-from ..utils.cache import cache
+from ..utils.cache import cache, http_cache
+from ..utils.greeks import calculate_chain_iv
+from ..utils.responses import ojsonify
 
 logger = logging.getLogger(__name__)
 
 options_bp = Blueprint('options', __name__)
 
+_SECONDS_PER_YEAR = 365.0 * 86400.0
+# Floor on time-to-expiry so expiring contracts don't divide by zero
+_MIN_TIME_TO_EXPIRY = 1.0 / (365.0 * 24.0)
+
 @options_bp.route('/options/<symbol>/chain', methods=['GET'])
 @jwt_required()
 @rate_limit_by_tier
+@http_cache(ttl=300)
+@cache(prefix="options_chain", ttl=300)
 async def get_options_chain(symbol: str):
     """Get options chain for a symbol"""
     try:
@@ -25,11 +34,11 @@ async def get_options_chain(symbol: str):
         strike_range = request.args.get('strike_range', 'near')
         option_type = request.args.get('type', 'both')
         
-        aggregator = current_app.aggregator
+        aggregator = options_bp.aggregator
         options_data = await aggregator.get_options_chain(symbol)
         
         if not options_data:
-            return jsonify({'error': f'No options data found for {symbol}'}), 404
+            return ojsonify({'error': f'No options data found for {symbol}'}), 404
         
         # Filter by expiration if provided
         if expiration and expiration != 'all':
@@ -40,52 +49,85 @@ async def get_options_chain(symbol: str):
                     'expiration': expiration,
                     'chain': options_data['chains'][expiration]
                 }
-                return jsonify(filtered_chain), 200
+                return ojsonify(filtered_chain), 200
             else:
-                return jsonify({'error': f'No options for expiration {expiration}'}), 404
+                return ojsonify({'error': f'No options for expiration {expiration}'}), 404
         
         # Filter by strike range
         if strike_range != 'all' and 'spot_price' in options_data:
             spot = options_data['spot_price']
+            near_band = 0.1 * spot
+            type_keys = ('calls', 'puts') if option_type == 'both' else (f'{option_type}s',)
             filtered_chains = {}
-            
+
             for exp, chain in options_data.get('chains', {}).items():
                 filtered_chain = {'calls': [], 'puts': []}
-                
-                for option_type_key in ['calls', 'puts']:
-                    if option_type != 'both' and option_type != option_type_key[:-1]:
+
+                for option_type_key in type_keys:
+                    options = chain.get(option_type_key, [])
+                    if not options:
                         continue
-                        
-                    for opt in chain.get(option_type_key, []):
-                        strike = opt['strike']
-                        
-                        if strike_range == 'near' and abs(strike - spot) / spot > 0.1:
-                            continue
-                        elif strike_range == 'itm':
-                            if option_type_key == 'calls' and strike >= spot:
-                                continue
-                            elif option_type_key == 'puts' and strike <= spot:
-                                continue
-                        elif strike_range == 'otm':
-                            if option_type_key == 'calls' and strike <= spot:
-                                continue
-                            elif option_type_key == 'puts' and strike >= spot:
-                                continue
-                        
-                        filtered_chain[option_type_key].append(opt)
-                
+
+                    # One vectorized comparison over the strike column
+                    # replaces the branchy per-option Python loop
+                    strikes = np.fromiter(
+                        (opt['strike'] for opt in options),
+                        dtype=np.float64, count=len(options)
+                    )
+                    if strike_range == 'near':
+                        mask = np.abs(strikes - spot) <= near_band
+                    elif strike_range == 'itm':
+                        mask = strikes < spot if option_type_key == 'calls' else strikes > spot
+                    elif strike_range == 'otm':
+                        mask = strikes > spot if option_type_key == 'calls' else strikes < spot
+                    else:
+                        # Unknown range keeps the chain unfiltered
+                        filtered_chain[option_type_key] = options
+                        continue
+
+                    filtered_chain[option_type_key] = [
+                        options[i] for i in np.nonzero(mask)[0]
+                    ]
+
                 if filtered_chain['calls'] or filtered_chain['puts']:
                     filtered_chains[exp] = filtered_chain
-            
-            options_data['chains'] = filtered_chains
-        
-        return jsonify(options_data), 200
+
+            # Build a fresh response dict: the aggregator hands every
+            # caller the same cached object, so assigning the filtered
+            # chains onto it would poison the cache for other requests
+            options_data = {**options_data, 'chains': filtered_chains}
+
+        # Deep chains serialize to multi-MB bodies; emit one expiration
+        # per chunk so TTFB is the first expiration, not the whole encode.
+        # Small responses stay on the buffered path, which benchmarks
+        # slightly faster and remains cacheable.
+        chains = options_data.get('chains', {})
+        if len(chains) > 8:
+            meta = orjson.dumps(
+                {k: v for k, v in options_data.items() if k != 'chains'}
+            )
+
+            def stream():
+                yield meta[:-1] + b',"chains":{' if len(meta) > 2 else b'{"chains":{'
+                first = True
+                for exp, chain in chains.items():
+                    if not first:
+                        yield b','
+                    yield orjson.dumps(exp) + b':' + orjson.dumps(chain)
+                    first = False
+                yield b'}}'
+
+            return current_app.response_class(
+                stream_with_context(stream()), mimetype='application/json'
+            )
+
+        return ojsonify(options_data), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting options chain: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
 
 
 @options_bp.route('/options/<symbol>/expirations', methods=['GET'])
@@ -96,20 +138,131 @@ async def get_options_expirations(symbol: str):
     try:
         symbol = validate_symbol(symbol)
         
-        aggregator = current_app.aggregator
-        options_data = await aggregator.get_options_chain(symbol)
-        
-        if not options_data:
-            return jsonify({'error': f'No options data found for {symbol}'}), 404
-        
-        return jsonify({
+        aggregator = options_bp.aggregator
+
+        # Only the expiration index is needed, not the full chains
+        expirations = await aggregator.get_expirations(symbol)
+
+        if not expirations:
+            return ojsonify({'error': f'No options data found for {symbol}'}), 404
+
+        return ojsonify({
             'symbol': symbol,
-            'expirations': options_data.get('expirations', [])
+            'expirations': expirations
         }), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting expirations: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
+
+
+@options_bp.route('/options/<symbol>/greeks', methods=['GET'])
+@jwt_required()
+@rate_limit_by_tier
+@http_cache(ttl=300)
+@cache(prefix="options_greeks", ttl=300)
+async def get_options_greeks(symbol: str):
+    """Get per-contract Black-Scholes Greeks across the options chain"""
+    try:
+        symbol = validate_symbol(symbol)
+        expiration = request.args.get('expiration')
+        risk_free_rate = validate_number(request.args.get('r', 0.05), 0.0, 0.25)
+
+        aggregator = options_bp.aggregator
+        options_data = await aggregator.get_options_chain(symbol)
+
+        if not options_data:
+            return ojsonify({'error': f'No options data found for {symbol}'}), 404
+
+        spot = options_data.get('spot_price')
+        if not spot:
+            return ojsonify({'error': f'No spot price available for {symbol}'}), 404
+
+        chains = options_data.get('chains', {})
+        if expiration:
+            if expiration not in chains:
+                return ojsonify({'error': f'No options for expiration {expiration}'}), 404
+            chains = {expiration: chains[expiration]}
+
+        now = datetime.utcnow()
+        expirations = {}
+        for exp, chain in chains.items():
+            contracts = chain.get('calls', []) + chain.get('puts', [])
+            if not contracts:
+                continue
+
+            try:
+                exp_date = validate_date(exp)
+            except ValueError:
+                continue
+            time_to_expiry = max(
+                (exp_date - now).total_seconds() / _SECONDS_PER_YEAR,
+                _MIN_TIME_TO_EXPIRY
+            )
+
+            n = len(contracts)
+            strikes = np.fromiter(
+                (c['strike'] for c in contracts), dtype=np.float64, count=n
+            )
+            sigma = np.fromiter(
+                (c.get('implied_volatility') or 0.0 for c in contracts),
+                dtype=np.float64, count=n
+            )
+            is_call = np.arange(n) < len(chain.get('calls', []))
+
+            # Solve IV from mid prices only for contracts the source did
+            # not quote a vol for; unsolvable quotes stay NaN
+            missing = sigma <= 0.0
+            if missing.any():
+                prices = np.fromiter(
+                    (c.get('mid') or c.get('last') or 0.0 for c in contracts),
+                    dtype=np.float64, count=n
+                )
+                solved = calculate_chain_iv(
+                    prices, spot, strikes, np.full(n, time_to_expiry),
+                    risk_free_rate, 0.0, is_call
+                )
+                sigma = np.where(missing, solved, sigma)
+            sigma = np.where(sigma > 0.0, sigma, np.nan)
+
+            expirations[exp] = _chain_greeks(
+                spot, strikes, time_to_expiry, risk_free_rate, sigma, is_call
+            )
+
+        return ojsonify({
+            'symbol': symbol,
+            'spot_price': spot,
+            'risk_free_rate': risk_free_rate,
+            'expirations': expirations
+        }), 200
+
+    except ValueError as e:
+        return ojsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error calculating greeks: {e}")
+        return ojsonify({'error': 'Internal server error'}), 500
+
+
+def _chain_greeks(spot, strikes, time_to_expiry, rate, sigma, is_call) -> dict:
+    """Vectorized Black-Scholes Greeks for one expiration slice.
+
+    d1/d2 and the normal densities are evaluated once over the whole
+    strike vector — two scipy C-loop calls instead of a Python loop per
+    contract. Contracts with NaN vol produce null Greeks.
+    """
+    sqrt_t = np.sqrt(time_to_expiry)
+    d1 = (np.log(spot / strikes) + (rate + 0.5 * sigma ** 2) * time_to_expiry) / (sigma * sqrt_t)
+    pdf_d1 = norm.pdf(d1)
+    cdf_d1 = norm.cdf(d1)
+
+    return {
+        'strikes': strikes,
+        'is_call': is_call,
+        'implied_volatility': sigma,
+        'delta': np.where(is_call, cdf_d1, cdf_d1 - 1.0),
+        'gamma': pdf_d1 / (spot * sigma * sqrt_t),
+        'vega': spot * pdf_d1 * sqrt_t
+    }
 
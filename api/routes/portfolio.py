@@ -2,8 +2,13 @@
 from flask import Blueprint, request, jsonify, g
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy import func
+from datetime import datetime
+import logging
 
 from ..database.models import db, Portfolio, Holding
+from ..utils.validators import validate_symbol, validate_date
+
+logger = logging.getLogger(__name__)
 
 portfolio_bp = Blueprint('portfolio', __name__)
 
@@ -15,6 +20,15 @@ async def get_portfolios():
         user_id = get_jwt_identity()
         
         portfolios = Portfolio.query.filter_by(user_id=user_id).all()
+
+        # One grouped count instead of a COUNT(*) round-trip per
+        # portfolio from holdings.count() in the loop
+        counts = dict(
+            db.session.query(Holding.portfolio_id, func.count())
+            .filter(Holding.portfolio_id.in_([p.id for p in portfolios]))
+            .group_by(Holding.portfolio_id)
+            .all()
+        ) if portfolios else {}
         
         return jsonify({
             'portfolios': [
@@ -23,7 +37,7 @@ async def get_portfolios():
                     'name': p.name,
                     'description': p.description,
                     'created_at': p.created_at.isoformat(),
-                    'holdings_count': p.holdings.count()
+                    'holdings_count': counts.get(p.id, 0)
                 }
                 for p in portfolios
             ],
@@ -41,7 +55,7 @@ async def create_portfolio():
     """Create new portfolio"""
     try:
         user_id = get_jwt_identity()
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         
         name = data.get('name')
         if not name:
@@ -88,14 +102,20 @@ async def get_portfolio_details(portfolio_id: str):
         holdings = []
         total_value = 0
         total_cost = 0
-        
-        aggregator = current_app.aggregator
-        
-        for holding in portfolio.holdings:
-            # Get current price
-            quote = await aggregator.get_quote(holding.symbol)
+
+        aggregator = portfolio_bp.aggregator
+
+        # One bulk call for every distinct symbol: cached quotes arrive
+        # in a single MGET and only the misses fan out to the sources,
+        # so two lots of the same symbol share one lookup
+        position_list = list(portfolio.holdings)
+        symbols = list(dict.fromkeys(h.symbol for h in position_list))
+        quotes = await aggregator.get_quotes(symbols)
+
+        for holding in position_list:
+            quote = quotes.get(holding.symbol)
             current_price = quote['price'] if quote else float(holding.purchase_price)
-            
+
             current_value = float(holding.quantity) * current_price
             cost_basis = float(holding.quantity) * float(holding.purchase_price)
             
@@ -141,7 +161,7 @@ async def add_holding(portfolio_id: str):
     """Add holding to portfolio"""
     try:
         user_id = get_jwt_identity()
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         
         # Verify portfolio ownership
         portfolio = Portfolio.query.filter_by(
@@ -1,9 +1,24 @@
 # api/routes/technical.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, current_app
 from flask_jwt_extended import jwt_required
+from datetime import datetime, timedelta
+import logging
+
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+from ..utils.validators import validate_symbol
+from ..utils.decorators import rate_limit_by_tier
+from ..utils.responses import ojsonify
+from ..data.aggregator import DataAggregator
+
+logger = logging.getLogger(__name__)
+
 technical_bp = Blueprint('technical', __name__)
 
 @technical_bp.route('/indicators/<symbol>', methods=['GET'])
@@ -20,14 +35,14 @@ async def get_technical_indicators(symbol: str):
             indicators = ['sma', 'ema', 'rsi', 'macd']
         
         # Get historical data
-        aggregator: DataAggregator = current_app.aggregator
+        aggregator: DataAggregator = technical_bp.aggregator
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=period * 2)  # Get extra data for calculations
         
         data = await aggregator.get_historical(symbol, start_date, end_date, '1d')
         
         if not data:
-            return jsonify({'error': f'No data found for {symbol}'}), 404
+            return ojsonify({'error': f'No data found for {symbol}'}), 404
         
         # Convert to DataFrame
         df = pd.DataFrame(data)
@@ -55,88 +70,151 @@ async def get_technical_indicators(symbol: str):
         if 'stochastic' in indicators:
             results['indicators']['stochastic'] = calculate_stochastic(df, period)
         
-        return jsonify(results), 200
+        return ojsonify(results), 200
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error calculating indicators: {e}")
-        return jsonify({'error': 'Internal server error'}), 500
+        return ojsonify({'error': 'Internal server error'}), 500
+
+
+# Indicators are emitted column-wise (parallel timestamp/value arrays)
+# rather than as one dict per row: formatting the index once and grabbing
+# each series as a whole ndarray avoids N dict allocations and N hashed
+# .loc lookups per indicator.
+
+def _timestamps(index: pd.DatetimeIndex) -> list:
+    """Format the shared timestamp column in one vectorized pass"""
+    return index.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+
+
+def _column(values) -> list:
+    """Series or array values as floats with NaN mapped to None"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _macd_kernel(close):
+    """All three MACD EMAs in one forward pass over the close array.
+
+    Matches pandas ewm(span=n, adjust=False).mean() semantics (seeded
+    with the first sample) while keeping the three accumulators in
+    registers instead of allocating intermediate Series per span.
+    """
+    n = close.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    histogram = np.empty(n)
+
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+
+    e12 = close[0]
+    e26 = close[0]
+    sig = 0.0
+    for i in range(n):
+        if i > 0:
+            c = close[i]
+            e12 += a12 * (c - e12)
+            e26 += a26 * (c - e26)
+        m = e12 - e26
+        sig = m if i == 0 else sig + a9 * (m - sig)
+        macd[i] = m
+        signal[i] = sig
+        histogram[i] = m - sig
+
+    return macd, signal, histogram
+
+
+def _rsi_kernel(close, period):
+    """RSI with Wilder smoothing in one pass, no intermediate arrays.
+
+    The previous rolling-mean formulation allocated two mask Series and
+    two rolling windows per call, and used a simple moving average where
+    Wilder's definition calls for his recursive smoothing. Values before
+    the seed window are NaN, as with the rolling version.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= period:
+        return rsi
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    rsi[period] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        rsi[i] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return rsi
+
+
+if njit is not None:
+    _macd_kernel = njit(cache=True)(_macd_kernel)
+    _rsi_kernel = njit(cache=True)(_rsi_kernel)
 
 
 def calculate_sma(df: pd.DataFrame, period: int) -> dict:
     """Calculate Simple Moving Average"""
     sma = df['close'].rolling(window=period).mean()
-    
+
     return {
         'period': period,
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'value': float(val) if not pd.isna(val) else None
-            }
-            for ts, val in sma.items()
-        ]
+        'timestamps': _timestamps(sma.index),
+        'values': _column(sma)
     }
 
 
 def calculate_ema(df: pd.DataFrame, period: int) -> dict:
     """Calculate Exponential Moving Average"""
     ema = df['close'].ewm(span=period, adjust=False).mean()
-    
+
     return {
         'period': period,
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'value': float(val) if not pd.isna(val) else None
-            }
-            for ts, val in ema.items()
-        ]
+        'timestamps': _timestamps(ema.index),
+        'values': _column(ema)
     }
 
 
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> dict:
     """Calculate Relative Strength Index"""
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    
+    close = df['close'].to_numpy(dtype=np.float64)
+    rsi = _rsi_kernel(close, period)
+
     return {
         'period': period,
         'overbought': 70,
         'oversold': 30,
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'value': float(val) if not pd.isna(val) else None
-            }
-            for ts, val in rsi.items()
-        ]
+        'timestamps': _timestamps(df.index),
+        'values': _column(rsi)
     }
 
 
 def calculate_macd(df: pd.DataFrame) -> dict:
     """Calculate MACD"""
-    exp1 = df['close'].ewm(span=12, adjust=False).mean()
-    exp2 = df['close'].ewm(span=26, adjust=False).mean()
-    macd = exp1 - exp2
-    signal = macd.ewm(span=9, adjust=False).mean()
-    histogram = macd - signal
-    
+    close = df['close'].to_numpy(dtype=np.float64)
+    macd, signal, histogram = _macd_kernel(close)
+
     return {
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'macd': float(macd.loc[ts]) if not pd.isna(macd.loc[ts]) else None,
-                'signal': float(signal.loc[ts]) if not pd.isna(signal.loc[ts]) else None,
-                'histogram': float(histogram.loc[ts]) if not pd.isna(histogram.loc[ts]) else None
-            }
-            for ts in macd.index
-        ]
+        'timestamps': _timestamps(df.index),
+        'macd': _column(macd),
+        'signal': _column(signal),
+        'histogram': _column(histogram)
     }
 
 
@@ -144,22 +222,17 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: int =
     """Calculate Bollinger Bands"""
     sma = df['close'].rolling(window=period).mean()
     std = df['close'].rolling(window=period).std()
-    
+
     upper = sma + (std * std_dev)
     lower = sma - (std * std_dev)
-    
+
     return {
         'period': period,
         'std_dev': std_dev,
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'upper': float(upper.loc[ts]) if not pd.isna(upper.loc[ts]) else None,
-                'middle': float(sma.loc[ts]) if not pd.isna(sma.loc[ts]) else None,
-                'lower': float(lower.loc[ts]) if not pd.isna(lower.loc[ts]) else None
-            }
-            for ts in sma.index
-        ]
+        'timestamps': _timestamps(sma.index),
+        'upper': _column(upper),
+        'middle': _column(sma),
+        'lower': _column(lower)
     }
 
 
@@ -167,20 +240,15 @@ def calculate_stochastic(df: pd.DataFrame, period: int = 14) -> dict:
     """Calculate Stochastic Oscillator"""
     low_min = df['low'].rolling(window=period).min()
     high_max = df['high'].rolling(window=period).max()
-    
+
     k_percent = 100 * ((df['close'] - low_min) / (high_max - low_min))
     d_percent = k_percent.rolling(window=3).mean()
-    
+
     return {
         'period': period,
         'overbought': 80,
         'oversold': 20,
-        'values': [
-            {
-                'timestamp': ts.isoformat(),
-                'k': float(k_percent.loc[ts]) if not pd.isna(k_percent.loc[ts]) else None,
-                'd': float(d_percent.loc[ts]) if not pd.isna(d_percent.loc[ts]) else None
-            }
-            for ts in k_percent.index
-        ]
+        'timestamps': _timestamps(k_percent.index),
+        'k': _column(k_percent),
+        'd': _column(d_percent)
     }
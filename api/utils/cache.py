@@ -0,0 +1,227 @@
+# api/utils/cache.py
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+from typing import Any, Optional
+
+import orjson
+from cachetools import TTLCache
+from flask import current_app, request
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManager:
+    """
+    Thin Redis cache with orjson serialization.
+
+    Values are stored as orjson-encoded bytes, so anything JSON-serializable
+    (quote dicts, historical bar lists) round-trips. Redis errors are treated
+    as cache misses — the cache must never take down a data path.
+
+    A small process-local L1 sits in front of Redis: a handful of hot
+    symbols dominate traffic, and a short-TTL local hit skips the network
+    hop entirely while Redis still shares values across workers.
+    """
+
+    def __init__(self, redis_client, default_timeout: int = 300,
+                 l1_maxsize: int = 2048, l1_ttl: int = 2):
+        self.redis = redis_client
+        self.default_timeout = default_timeout
+        self.hits = 0
+        self.misses = 0
+        self._l1 = TTLCache(maxsize=l1_maxsize, ttl=l1_ttl)
+        self._l1_lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on miss/error"""
+        with self._l1_lock:
+            value = self._l1.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        try:
+            raw = self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get error for {key}: {e}")
+            return None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        value = orjson.loads(raw)
+        with self._l1_lock:
+            self._l1[key] = value
+        return value
+
+    async def set(self, key: str, value: Any, timeout: int = None) -> bool:
+        """Cache a value with a TTL (seconds)"""
+        with self._l1_lock:
+            self._l1[key] = value
+        try:
+            self.redis.set(
+                key,
+                orjson.dumps(value),
+                ex=timeout or self.default_timeout
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Cache set error for {key}: {e}")
+            return False
+
+    async def get_many(self, keys) -> dict:
+        """
+        Get several keys in one round-trip (MGET).
+
+        Returns a dict of key -> value for the keys that hit; misses are
+        simply absent. Callers batching per-symbol lookups pay one RTT
+        instead of one per key.
+        """
+        if not keys:
+            return {}
+
+        found = {}
+        remaining = []
+        with self._l1_lock:
+            for key in keys:
+                value = self._l1.get(key)
+                if value is not None:
+                    found[key] = value
+                else:
+                    remaining.append(key)
+        self.hits += len(found)
+
+        if not remaining:
+            return found
+
+        try:
+            raw_values = self.redis.mget(remaining)
+        except Exception as e:
+            logger.warning(f"Cache get_many error: {e}")
+            return found
+
+        with self._l1_lock:
+            for key, raw in zip(remaining, raw_values):
+                if raw is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    value = orjson.loads(raw)
+                    found[key] = value
+                    self._l1[key] = value
+        return found
+
+    async def set_many(self, mapping: dict, timeout: int = None) -> bool:
+        """Cache several key/value pairs in one pipelined round-trip"""
+        if not mapping:
+            return True
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            ttl = timeout or self.default_timeout
+            for key, value in mapping.items():
+                pipe.set(key, orjson.dumps(value), ex=ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache set_many error: {e}")
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Remove a key from the cache"""
+        with self._l1_lock:
+            self._l1.pop(key, None)
+        try:
+            self.redis.delete(key)
+            return True
+        except Exception as e:
+            logger.warning(f"Cache delete error for {key}: {e}")
+            return False
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+def cache(prefix: str, ttl: int = 300):
+    """
+    Cache a route's successful JSON response in Redis.
+
+    The key includes the request path and query string, so parameterized
+    endpoints cache per-variant. Only 200 responses are cached.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        async def wrapper(*args, **kwargs):
+            manager = getattr(current_app, 'cache', None)
+            key = f"route:{prefix}:{request.full_path}"
+
+            if manager:
+                cached = await manager.get(key)
+                if cached is not None:
+                    return current_app.response_class(
+                        orjson.dumps(cached),
+                        mimetype='application/json'
+                    )
+
+            result = f(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+
+            response, status = result if isinstance(result, tuple) else (result, 200)
+
+            # Streamed responses are passed through: get_data() would
+            # materialize the whole body and defeat the point of streaming
+            if manager and status == 200 and not response.is_streamed:
+                await manager.set(key, orjson.loads(response.get_data()), timeout=ttl)
+
+            return result
+
+        return wrapper
+    return decorator
+
+
+def http_cache(ttl: int = 300):
+    """
+    Mark a route's successful responses cacheable at the HTTP layer.
+
+    Sets Cache-Control and a body-hash ETag, and answers If-None-Match
+    revalidations with an empty 304 — repeat reads of slow-changing
+    endpoints are then served by browser and CDN caches without touching
+    the origin at all.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        async def wrapper(*args, **kwargs):
+            result = f(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+
+            response, status = result if isinstance(result, tuple) else (result, 200)
+            if status != 200 or response.is_streamed:
+                return result
+
+            etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+
+            if request.headers.get('If-None-Match') == etag:
+                not_modified = current_app.response_class(status=304)
+                not_modified.headers['ETag'] = etag
+                not_modified.headers['Cache-Control'] = f'public, max-age={ttl}'
+                return not_modified
+
+            response.headers['Cache-Control'] = f'public, max-age={ttl}'
+            response.headers['ETag'] = etag
+            return response, 200
+
+        return wrapper
+    return decorator
@@ -0,0 +1,20 @@
+# api/utils/concurrency.py
+import asyncio
+from typing import Any, Iterable, List
+
+
+async def gather_limited(coros: Iterable, limit: int = 20) -> List[Any]:
+    """Run coroutines concurrently with a concurrency cap.
+
+    Batch endpoints fan out up to 100 upstream calls; running them all at
+    once invites rate-limit storms, while awaiting them one by one costs
+    O(N) round-trips. The semaphore keeps at most `limit` in flight.
+    Exceptions are returned in place of results rather than raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
@@ -4,9 +4,25 @@ Greeks calculation engine for options pricing and risk analysis.
 Implements Black-Scholes model and various numerical methods for accurate Greeks computation.
 """
 
+import math
+
 import numpy as np
 from scipy.stats import norm
+from scipy.special import erf
 from scipy.optimize import minimize_scalar, brentq
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+    prange = range
+
+try:
+    from numba import cuda
+    _HAS_CUDA = cuda.is_available()
+except Exception:  # no numba, no driver, or no device
+    cuda = None
+    _HAS_CUDA = False
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -542,6 +558,285 @@ class GreeksCalculator:
         return total
 
 
+# Chain-level vectorized computation
+#
+# Option Greeks and implied volatilities only need about 4 significant
+# digits, so chain-sized arrays are stored as float32: half the memory
+# traffic of numpy's float64 default and twice the SIMD lanes per vector
+# register, which matters once whole chains are priced at once.
+CHAIN_DTYPE = np.float32
+
+_SQRT_2 = np.float32(np.sqrt(2.0))
+_INV_SQRT_2PI = np.float32(1.0 / np.sqrt(2.0 * np.pi))
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF that preserves float32 arrays"""
+    return 0.5 * (1.0 + erf(x / _SQRT_2))
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal PDF that preserves float32 arrays"""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+if njit is not None:
+    # The explicit signature makes numba compile at declaration time instead
+    # of on the first call, so the first chain request after a process start
+    # does not pay multi-second JIT latency; cache=True persists the compiled
+    # object across processes (honouring NUMBA_CACHE_DIR when set).
+    @njit(
+        'float32[:](float32[:], float32, float32[:], float32[:], '
+        'float32, float32, boolean[:], int64, float32)',
+        parallel=True, fastmath=True, cache=True
+    )
+    def _iv_newton_kernel(prices, spot, strikes, times, rate, div_yield,
+                          is_call, max_iterations, tolerance):
+        n = prices.shape[0]
+        out = np.empty(n, dtype=np.float32)
+
+        for i in prange(n):
+            price = prices[i]
+            K = strikes[i]
+            T = times[i]
+            vol = 0.3
+
+            # vol-independent terms, hoisted out of the Newton iteration
+            log_SK = math.log(spot / K)
+            sqrt_T = math.sqrt(T)
+            exp_qT = math.exp(-div_yield * T)
+            exp_rT = math.exp(-rate * T)
+
+            # no-arbitrage bounds: quotes outside them have no finite IV
+            if is_call[i]:
+                intrinsic = max(spot * exp_qT - K * exp_rT, 0.0)
+                max_price = spot * exp_qT
+            else:
+                intrinsic = max(K * exp_rT - spot * exp_qT, 0.0)
+                max_price = K * exp_rT
+
+            if price <= intrinsic + 1e-8 or price >= max_price - 1e-8:
+                out[i] = np.nan
+                continue
+
+            for _ in range(max_iterations):
+                d1 = (log_SK +
+                      (rate - div_yield + 0.5 * vol * vol) * T) / (vol * sqrt_T)
+                d2 = d1 - vol * sqrt_T
+
+                nd1 = 0.5 * (1.0 + math.erf(d1 / 1.4142135623730951))
+                nd2 = 0.5 * (1.0 + math.erf(d2 / 1.4142135623730951))
+
+                if is_call[i]:
+                    theoretical = spot * exp_qT * nd1 - K * exp_rT * nd2
+                else:
+                    theoretical = (K * exp_rT * (1.0 - nd2) -
+                                   spot * exp_qT * (1.0 - nd1))
+
+                vega = (spot * 0.3989422804014327 *
+                        math.exp(-0.5 * d1 * d1) * sqrt_T * exp_qT)
+
+                price_diff = theoretical - price
+                if abs(price_diff) < tolerance:
+                    break
+
+                if vega < 1e-8:
+                    vega = 1e-8
+                vol = vol - price_diff / vega
+                if vol < 0.001:
+                    vol = 0.001
+                elif vol > 5.0:
+                    vol = 5.0
+
+            out[i] = vol
+
+        return out
+else:
+    _iv_newton_kernel = None
+
+
+# Chains beyond this size dominate the host/device transfer cost, so the
+# GPU kernel is only worth launching for large multi-symbol batches.
+CUDA_MIN_CHAIN_SIZE = 10_000
+
+if _HAS_CUDA:
+    @cuda.jit
+    def _iv_newton_cuda(prices, spot, strikes, times, rate, div_yield,
+                        is_call, max_iterations, tolerance, out):
+        i = cuda.grid(1)
+        if i >= prices.shape[0]:
+            return
+
+        price = prices[i]
+        K = strikes[i]
+        T = times[i]
+        vol = 0.3
+
+        # vol-independent terms, hoisted out of the Newton iteration
+        log_SK = math.log(spot / K)
+        sqrt_T = math.sqrt(T)
+        exp_qT = math.exp(-div_yield * T)
+        exp_rT = math.exp(-rate * T)
+
+        # no-arbitrage bounds: quotes outside them have no finite IV
+        if is_call[i]:
+            intrinsic = max(spot * exp_qT - K * exp_rT, 0.0)
+            max_price = spot * exp_qT
+        else:
+            intrinsic = max(K * exp_rT - spot * exp_qT, 0.0)
+            max_price = K * exp_rT
+
+        if price <= intrinsic + 1e-8 or price >= max_price - 1e-8:
+            out[i] = math.nan
+            return
+
+        for _ in range(max_iterations):
+            d1 = (log_SK +
+                  (rate - div_yield + 0.5 * vol * vol) * T) / (vol * sqrt_T)
+            d2 = d1 - vol * sqrt_T
+
+            nd1 = 0.5 * (1.0 + math.erf(d1 / 1.4142135623730951))
+            nd2 = 0.5 * (1.0 + math.erf(d2 / 1.4142135623730951))
+
+            if is_call[i]:
+                theoretical = spot * exp_qT * nd1 - K * exp_rT * nd2
+            else:
+                theoretical = (K * exp_rT * (1.0 - nd2) -
+                               spot * exp_qT * (1.0 - nd1))
+
+            vega = (spot * 0.3989422804014327 *
+                    math.exp(-0.5 * d1 * d1) * sqrt_T * exp_qT)
+
+            price_diff = theoretical - price
+            if abs(price_diff) < tolerance:
+                break
+
+            if vega < 1e-8:
+                vega = 1e-8
+            vol = vol - price_diff / vega
+            if vol < 0.001:
+                vol = 0.001
+            elif vol > 5.0:
+                vol = 5.0
+
+        out[i] = vol
+
+
+def _calculate_chain_iv_cuda(prices, spot, strikes, times, rate, div_yield,
+                             is_call, max_iterations, tolerance):
+    """Run the Newton IV kernel on the GPU, one thread per contract"""
+    n = prices.shape[0]
+    d_prices = cuda.to_device(prices)
+    d_strikes = cuda.to_device(strikes)
+    d_times = cuda.to_device(times)
+    d_is_call = cuda.to_device(is_call)
+    d_out = cuda.device_array(n, dtype=CHAIN_DTYPE)
+
+    threads = 256
+    blocks = (n + threads - 1) // threads
+    _iv_newton_cuda[blocks, threads](
+        d_prices, spot, d_strikes, d_times, rate, div_yield,
+        d_is_call, max_iterations, tolerance, d_out
+    )
+    return d_out.copy_to_host()
+
+
+def calculate_chain_iv(
+    option_prices: np.ndarray,
+    spot_price: float,
+    strikes: np.ndarray,
+    times_to_expiry: np.ndarray,
+    risk_free_rate: float,
+    dividend_yield: float,
+    is_call: np.ndarray,
+    max_iterations: int = 100,
+    tolerance: float = 1e-5
+) -> np.ndarray:
+    """
+    Vectorized Newton-Raphson implied volatility for a whole options chain.
+
+    Dispatches to the CUDA kernel for chains of CUDA_MIN_CHAIN_SIZE or more
+    contracts when a GPU is available, otherwise to the AOT-compiled numba
+    CPU kernel, falling back to pure numpy. All numeric inputs are cast to
+    float32 (CHAIN_DTYPE); the ~1e-7 relative error of float32 arithmetic is
+    well inside the 1e-5 convergence tolerance used for IV.
+
+    Args:
+        option_prices: Market prices, one per contract
+        spot_price: Current underlying price
+        strikes: Strike prices, one per contract
+        times_to_expiry: Times to expiry in years, one per contract
+        risk_free_rate: Risk-free rate
+        dividend_yield: Dividend yield
+        is_call: Boolean array, True for calls
+        max_iterations: Maximum Newton iterations
+        tolerance: Price convergence tolerance
+
+    Returns:
+        Array of implied volatilities (float32)
+    """
+    prices = np.ascontiguousarray(option_prices, dtype=CHAIN_DTYPE)
+    K = np.ascontiguousarray(strikes, dtype=CHAIN_DTYPE)
+    T = np.ascontiguousarray(times_to_expiry, dtype=CHAIN_DTYPE)
+    is_call = np.ascontiguousarray(is_call, dtype=bool)
+
+    if _HAS_CUDA and prices.shape[0] >= CUDA_MIN_CHAIN_SIZE:
+        return _calculate_chain_iv_cuda(
+            prices, CHAIN_DTYPE(spot_price), K, T,
+            CHAIN_DTYPE(risk_free_rate), CHAIN_DTYPE(dividend_yield),
+            is_call, max_iterations, CHAIN_DTYPE(tolerance)
+        )
+
+    if _iv_newton_kernel is not None:
+        return _iv_newton_kernel(
+            prices, CHAIN_DTYPE(spot_price), K, T,
+            CHAIN_DTYPE(risk_free_rate), CHAIN_DTYPE(dividend_yield),
+            is_call, max_iterations, CHAIN_DTYPE(tolerance)
+        )
+
+    S = CHAIN_DTYPE(spot_price)
+    r = CHAIN_DTYPE(risk_free_rate)
+    q = CHAIN_DTYPE(dividend_yield)
+
+    # vol-independent arrays, hoisted out of the Newton iteration
+    log_SK = np.log(S / K)
+    sqrt_T = np.sqrt(T)
+    exp_qT = np.exp(-q * T)
+    exp_rT = np.exp(-r * T)
+
+    # No-arbitrage bounds: quotes at or below intrinsic value (or at or
+    # above the maximum attainable price) have no finite implied vol, so
+    # they are marked NaN and excluded from the Newton iteration
+    intrinsic = np.where(is_call,
+                         np.maximum(S * exp_qT - K * exp_rT, 0.0),
+                         np.maximum(K * exp_rT - S * exp_qT, 0.0))
+    max_price = np.where(is_call, S * exp_qT, K * exp_rT)
+    valid = (prices > intrinsic + 1e-8) & (prices < max_price - 1e-8)
+
+    vol = np.where(valid, CHAIN_DTYPE(0.3), CHAIN_DTYPE(np.nan))
+    active = valid.copy()
+
+    for _ in range(max_iterations):
+        d1 = (log_SK + (r - q + 0.5 * vol * vol) * T) / (vol * sqrt_T)
+        d2 = d1 - vol * sqrt_T
+
+        call_price = S * exp_qT * _norm_cdf(d1) - K * exp_rT * _norm_cdf(d2)
+        put_price = K * exp_rT * _norm_cdf(-d2) - S * exp_qT * _norm_cdf(-d1)
+        theoretical = np.where(is_call, call_price, put_price)
+
+        vega = S * _norm_pdf(d1) * sqrt_T * exp_qT
+
+        price_diff = theoretical - prices
+        active &= np.abs(price_diff) >= tolerance
+        if not active.any():
+            break
+
+        step = price_diff / np.maximum(vega, CHAIN_DTYPE(1e-8))
+        vol = np.where(active, np.clip(vol - step, 0.001, 5.0), vol)
+
+    return vol
+
+
 # Utility functions
 
 def greeks_to_dict(greeks: Greeks) -> Dict[str, float]:
@@ -0,0 +1,18 @@
+# api/utils/responses.py
+import orjson
+from flask import current_app
+
+
+def ojsonify(obj, status: int = 200):
+    """jsonify drop-in that encodes straight to bytes with orjson.
+
+    Even with the app's orjson JSON provider, jsonify decodes the encoded
+    bytes to str and re-encodes them into the response body. This skips
+    that round trip, and OPT_SERIALIZE_NUMPY lets routes hand over NumPy
+    arrays and scalars without a .tolist() pass.
+    """
+    return current_app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
@@ -0,0 +1,20 @@
+# api/utils/timestamps.py
+from datetime import datetime
+import time
+
+# [epoch_second, formatted] pair. List mutation is fine under the GIL: a
+# racing request at a second boundary just re-formats the same instant.
+_ts_cache = [0, '']
+
+
+def iso_now() -> str:
+    """ISO-8601 UTC timestamp, cached at one-second granularity.
+
+    Response timestamps don't need microseconds, and at high request
+    rates this replaces a datetime construction plus isoformat() per
+    call with a single int comparison.
+    """
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, datetime.utcfromtimestamp(t).isoformat()]
+    return _ts_cache[1]
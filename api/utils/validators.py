@@ -1,41 +1,69 @@
 # api/utils/validators.py
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple
 import re
 
+# Compiled once; validators run on every request argument, and per-call
+# re.match pays flag hashing and cache lookups even for cached patterns
+_SYMBOL_RE = re.compile(r'^[A-Z0-9\-\.]{1,20}$')
+_CRYPTO_SYMBOL_RE = re.compile(r'^[A-Z0-9]{2,10}(-[A-Z]{3,4})?$')
+
+
 def validate_symbol(symbol: str) -> str:
     """Validate and normalize stock symbol"""
     if not symbol or not isinstance(symbol, str):
         raise ValueError("Symbol must be a non-empty string")
-    
+
+    return _validate_symbol_cached(symbol)
+
+
+# Pure string -> string, and the traded-symbol universe is small, so
+# repeated symbols skip the upper/strip/regex work entirely. Invalid
+# symbols re-raise on every call; lru_cache does not cache exceptions.
+@lru_cache(maxsize=4096)
+def _validate_symbol_cached(symbol: str) -> str:
     symbol = symbol.upper().strip()
-    
+
     # Basic symbol validation
-    if not re.match(r'^[A-Z0-9\-\.]{1,20}$', symbol):
+    if not _SYMBOL_RE.match(symbol):
         raise ValueError(f"Invalid symbol format: {symbol}")
-    
+
     return symbol
 
 
+_DATE_FORMATS = (
+    '%Y/%m/%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y'
+)
+
+
 def validate_date(date_str: str) -> datetime:
     """Validate and parse date string"""
     if isinstance(date_str, datetime):
         return date_str
-    
-    formats = [
-        '%Y-%m-%d',
-        '%Y-%m-%d %H:%M:%S',
-        '%Y/%m/%d',
-        '%d/%m/%Y',
-        '%d-%m-%Y'
-    ]
-    
-    for fmt in formats:
+
+    return _parse_date_cached(date_str)
+
+
+# The same date strings recur constantly (expirations, range endpoints),
+# and strptime pays a format-parse plus locale lookup per call; cache
+# hits skip parsing entirely. ISO dates — the common case — take the
+# C fromisoformat fast path before the strptime fallbacks.
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str) -> datetime:
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
-    
+
     raise ValueError(f"Invalid date format: {date_str}")
 
 
@@ -50,4 +78,40 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[datetime, datet
     # Limit range to prevent excessive data requests
     max_days = 365 * 5  # 5 years
     if (end - start).days > max_days:
-        raise ValueError(f"Date range cannot 
\ No newline at end of file
+        raise ValueError(f"Date range cannot exceed {max_days} days")
+
+    return start, end
+
+
+def validate_crypto_symbol(symbol: str) -> str:
+    """Validate and normalize crypto symbol (e.g. BTC or BTC-USD)"""
+    if not symbol or not isinstance(symbol, str):
+        raise ValueError("Symbol must be a non-empty string")
+
+    return _validate_crypto_symbol_cached(symbol)
+
+
+@lru_cache(maxsize=4096)
+def _validate_crypto_symbol_cached(symbol: str) -> str:
+    symbol = symbol.upper().strip()
+
+    if not _CRYPTO_SYMBOL_RE.match(symbol):
+        raise ValueError(f"Invalid crypto symbol format: {symbol}")
+
+    return symbol
+
+
+def validate_number(value, min_val: float = None, max_val: float = None) -> float:
+    """Validate a numeric parameter with optional bounds"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid number: {value}")
+
+    if min_val is not None and number < min_val:
+        raise ValueError(f"Value must be at least {min_val}")
+
+    if max_val is not None and number > max_val:
+        raise ValueError(f"Value must be at most {max_val}")
+
+    return number
\ No newline at end of file
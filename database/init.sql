@@ -6,21 +6,29 @@ CREATE EXTENSION IF NOT EXISTS timescaledb;
 CREATE TABLE IF NOT EXISTS market_data (
     time TIMESTAMPTZ NOT NULL,
     symbol VARCHAR(20) NOT NULL,
-    open NUMERIC(20, 8),
-    high NUMERIC(20, 8),
-    low NUMERIC(20, 8),
-    close NUMERIC(20, 8),
+    open DOUBLE PRECISION,
+    high DOUBLE PRECISION,
+    low DOUBLE PRECISION,
+    close DOUBLE PRECISION,
     volume BIGINT,
     source VARCHAR(50)
 );
 
--- Create hypertable for time-series data
-SELECT create_hypertable('market_data', 'time', if_not_exists => TRUE);
+-- Create hypertable for time-series data (daily chunks so constraint
+-- exclusion prunes to one chunk for intraday queries)
+SELECT create_hypertable('market_data', 'time',
+    chunk_time_interval => INTERVAL '1 day',
+    if_not_exists => TRUE);
 
 -- Create indexes
-CREATE INDEX IF NOT EXISTS idx_market_data_symbol_time 
+CREATE INDEX IF NOT EXISTS idx_market_data_symbol_time
 ON market_data (symbol, time DESC);
 
+-- BRIN on time: append-only inserts keep the column physically ordered,
+-- so a BRIN index is 100-1000x smaller than a btree and cheap to maintain
+CREATE INDEX IF NOT EXISTS idx_market_data_time_brin
+ON market_data USING BRIN (time);
+
 -- Set up continuous aggregates for common queries
 CREATE MATERIALIZED VIEW IF NOT EXISTS market_data_hourly
 WITH (timescaledb.continuous) AS
@@ -44,15 +52,50 @@ SELECT add_continuous_aggregate_policy('market_data_hourly',
 -- Data retention policy (keep raw data for 1 year)
 SELECT add_retention_policy('market_data', INTERVAL '1 year');
 
--- Compression policy (compress data older than 1 week)
+-- Compression policy (compress data older than 1 week, segmented by
+-- symbol so per-symbol scans decompress only their own rows)
+ALTER TABLE market_data SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'symbol'
+);
 SELECT add_compression_policy('market_data', INTERVAL '1 week');
 
--- Create additional indexes for performance
-CREATE INDEX IF NOT EXISTS idx_news_articles_published 
-ON news_articles (published_at DESC);
+-- Create additional indexes for performance (covering: payload columns in
+-- INCLUDE let these resolve as index-only scans)
+CREATE INDEX IF NOT EXISTS idx_news_articles_published
+ON news_articles (published_at DESC)
+INCLUDE (title, url, source);
+
+-- Multi-symbol containment (symbols @> '[...]') in /news; jsonb_path_ops
+-- indexes only the containment operator and stays much smaller
+CREATE INDEX IF NOT EXISTS idx_news_symbols_path
+ON news_articles USING GIN (symbols jsonb_path_ops);
+
+-- Full-text search: the generated tsvector is indexed once at write time
+-- and /news matches it with @@ plainto_tsquery
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_news_search
+ON news_articles USING GIN (search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_api_requests_user_created
+ON api_requests (user_id, created_at DESC)
+INCLUDE (endpoint, status_code, response_time);
+
+-- Narrow per-symbol link rows so symbol-filtered news queries use a plain
+-- btree instead of the JSONB GIN index plus per-match heap fetches
+CREATE TABLE IF NOT EXISTS news_article_symbols (
+    article_id UUID NOT NULL REFERENCES news_articles (id) ON DELETE CASCADE,
+    symbol VARCHAR(20) NOT NULL,
+    published_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (article_id, symbol)
+);
 
-CREATE INDEX IF NOT EXISTS idx_api_requests_user_created 
-ON api_requests (user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_symbol_time
+ON news_article_symbols (symbol, published_at DESC);
 
 -- Create functions for common queries
 CREATE OR REPLACE FUNCTION get_latest_price(p_symbol VARCHAR)